@@ -115,7 +115,10 @@ def decode_token(token: str, settings: AppSettings) -> dict[str, Any]:
 
 
 def _get_settings(request: Request) -> AppSettings:
-    return getattr(request.app.state, "settings", AppSettings())
+    # Only build the fallback when the app has no settings: AppSettings()
+    # re-reads the environment and .env file on every construction.
+    settings = getattr(request.app.state, "settings", None)
+    return settings if settings is not None else AppSettings()
 
 
 def _get_db_url(request: Request) -> str:
@@ -186,7 +189,7 @@ def require_user(
     request: Request,
     user: CurrentUser = Depends(auth_required),
 ) -> CurrentUser:
-    settings = getattr(request.app.state, "settings", AppSettings())
+    settings = _get_settings(request)
     if not settings.auth_enabled:
         return user
     if user.user_id == 0:
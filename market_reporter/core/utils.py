@@ -2,8 +2,26 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
-from typing import Any, Dict, Optional
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# (epoch second, formatted text) of the last utc_now_iso() call.  Replaced as a
+# whole tuple so concurrent readers never see a mismatched pair.
+_NOW_ISO_CACHE: Tuple[int, str] = (-1, "")
+
+# sys.stdout/sys.stderr are process-global, so overlapping silence_console()
+# blocks in worker threads share one redirect: the first block in swaps the
+# streams, the last one out restores them.  The lock only guards the swap.
+_CONSOLE_LOCK = threading.Lock()
+_CONSOLE_DEPTH = 0
+# (original stdout, original stderr, devnull sink) while silenced.
+_CONSOLE_SAVED: Optional[Tuple[Any, Any, Any]] = None
 
 
 def parse_json(content: str) -> Optional[Dict[str, Any]]:
@@ -31,3 +49,46 @@ def parse_json(content: str) -> Optional[Dict[str, Any]]:
         except Exception:
             return None
     return None
+
+
+@contextlib.contextmanager
+def silence_console() -> Iterator[None]:
+    """Discard stdout/stderr for the block (e.g. chatty akshare downloads).
+
+    Safe to enter from several threads at once: the redirect is reference
+    counted, and the body itself runs without holding any lock.
+    """
+    global _CONSOLE_DEPTH, _CONSOLE_SAVED
+    with _CONSOLE_LOCK:
+        if _CONSOLE_DEPTH == 0:
+            sink = open(os.devnull, "w", encoding="utf-8")
+            _CONSOLE_SAVED = (sys.stdout, sys.stderr, sink)
+            sys.stdout = sys.stderr = sink
+        _CONSOLE_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _CONSOLE_LOCK:
+            _CONSOLE_DEPTH -= 1
+            if _CONSOLE_DEPTH == 0 and _CONSOLE_SAVED is not None:
+                stdout, stderr, sink = _CONSOLE_SAVED
+                sys.stdout, sys.stderr = stdout, stderr
+                _CONSOLE_SAVED = None
+                sink.close()
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as ISO-8601 text at seconds precision.
+
+    Equivalent to ``datetime.now(timezone.utc).isoformat(timespec="seconds")``
+    but formats at most once per wall-clock second; tool calls fanned out in
+    one agent step share the cached string.
+    """
+    global _NOW_ISO_CACHE
+    second = int(time.time())
+    cached_second, text = _NOW_ISO_CACHE
+    if cached_second == second:
+        return text
+    text = datetime.fromtimestamp(second, tz=timezone.utc).isoformat()
+    _NOW_ISO_CACHE = (second, text)
+    return text
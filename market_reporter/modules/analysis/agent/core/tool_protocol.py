@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Awaitable, Callable, Dict, List, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 ToolExecutor = Callable[..., Awaitable[Dict[str, Any]]]
 
@@ -10,10 +10,14 @@ ToolExecutor = Callable[..., Awaitable[Dict[str, Any]]]
 class ToolDefinition(BaseModel):
     """Describes a tool that can be registered with the ToolRegistry."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     parameters: Dict[str, Any]
     source: Literal["builtin", "mcp", "skill"] = "builtin"
+    # Read-only tools whose identical overlapping calls may share one result.
+    idempotent: bool = False
 
     def to_openai_spec(self) -> Dict[str, Any]:
         return {
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from market_reporter.modules.analysis.agent.core.tool_protocol import (
     ToolDefinition,
@@ -18,6 +21,8 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: Dict[str, _Entry] = {}
+        self._specs: Optional[List[Dict[str, Any]]] = None
+        self._inflight: Dict[Tuple[str, str], "asyncio.Task[Dict[str, Any]]"] = {}
 
     def register(
         self,
@@ -39,6 +44,7 @@ class ToolRegistry:
                     definition.source,
                 )
         self._tools[key] = (definition, executor)
+        self._specs = None
 
     def has(self, name: str) -> bool:
         return name.strip().lower() in self._tools
@@ -51,7 +57,10 @@ class ToolRegistry:
         return [entry[0] for entry in sorted(self._tools.values(), key=lambda e: e[0].name)]
 
     def get_tool_specs(self) -> List[Dict[str, Any]]:
-        return [definition.to_openai_spec() for definition in self.list_tools()]
+        # Definitions are frozen, so specs only change when a tool is registered.
+        if self._specs is None:
+            self._specs = [definition.to_openai_spec() for definition in self.list_tools()]
+        return list(self._specs)
 
     async def execute(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         key = name.strip().lower()
@@ -59,4 +68,23 @@ class ToolRegistry:
         if entry is None:
             raise ValueError(f"Unknown tool: {name}")
         definition, executor = entry
-        return await executor(**arguments)
+        if not definition.idempotent:
+            return await executor(**arguments)
+        # Identical calls to a read-only tool that overlap share one upstream
+        # round trip; later callers get their own copy so downstream mutation
+        # stays local.
+        flight_key = (key, self._arguments_key(arguments))
+        task = self._inflight.get(flight_key)
+        if task is not None:
+            return copy.deepcopy(await asyncio.shield(task))
+        task = asyncio.ensure_future(executor(**arguments))
+        self._inflight[flight_key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _arguments_key(arguments: Dict[str, Any]) -> str:
+        try:
+            return json.dumps(arguments, ensure_ascii=False, sort_keys=True, default=str)
+        except Exception:
+            return repr(sorted(arguments.items(), key=lambda item: item[0]))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -49,13 +51,20 @@ class AgentOrchestrator:
         context = self._build_context(request)
         tool_specs = self.tool_registry.get_tool_specs()
 
-        traces: List[ToolCallTrace] = []
         tool_results: Dict[str, Dict[str, Any]] = {}
 
+        # The runtime may run a batch of calls concurrently; keep the result of
+        # the latest *issued* call per tool, not whichever finished last.
+        call_seq = itertools.count()
+        latest_seq: Dict[str, int] = {}
+
         async def executor(tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+            seq = next(call_seq)
             result = await self._execute_tool(tool, arguments)
             tool_name = tool.strip().lower()
-            tool_results[tool_name] = result
+            if seq >= latest_seq.get(tool_name, -1):
+                latest_seq[tool_name] = seq
+                tool_results[tool_name] = result
             return result
 
         runtime = OpenAIToolRuntime(provider_config=provider_cfg, api_key=api_key or "")
@@ -70,8 +79,25 @@ class AgentOrchestrator:
             skill_content=skill_content,
             on_step=on_step,
         )
-        traces.extend(runtime_traces)
+        # Evidence, guardrails and report formatting are pure CPU work over
+        # the collected results; keep them off the event loop.
+        return await asyncio.to_thread(
+            self._finalize,
+            request=request,
+            question=question,
+            runtime_draft=runtime_draft,
+            runtime_traces=runtime_traces,
+            tool_results=tool_results,
+        )
 
+    def _finalize(
+        self,
+        request: AgentRunRequest,
+        question: str,
+        runtime_draft: RuntimeDraft,
+        runtime_traces: List[ToolCallTrace],
+        tool_results: Dict[str, Dict[str, Any]],
+    ) -> AgentRunResult:
         # Merge runtime traces into tool_results
         for call in runtime_traces:
             tool_name = (call.tool or "").strip().lower()
@@ -106,6 +132,7 @@ class AgentOrchestrator:
             evidence_map=evidence,
             guardrail_issues=issues,
             confidence=adjusted_confidence,
+            conclusions=conclusions,
         )
 
         return AgentRunResult(
@@ -117,7 +144,7 @@ class AgentOrchestrator:
             },
             runtime_draft=runtime_draft,
             final_report=final_report,
-            tool_calls=traces,
+            tool_calls=runtime_traces,
             guardrail_issues=issues,
             evidence_map=evidence,
         )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from market_reporter.modules.analysis.agent.schemas import (
     AgentEvidence,
@@ -20,8 +20,11 @@ class AgentReportFormatter:
         evidence_map: List[AgentEvidence],
         guardrail_issues: List[GuardrailIssue],
         confidence: float,
+        conclusions: Optional[List[str]] = None,
     ) -> AgentFinalReport:
-        conclusions = self._build_conclusions(runtime_draft, evidence_map)
+        # Callers that already ran _build_conclusions pass the result through.
+        if conclusions is None:
+            conclusions = self._build_conclusions(runtime_draft, evidence_map)
         market_technical = self._build_market_technical(mode, tool_results)
         indicator_table = self._build_indicator_table(mode, tool_results)
         fundamentals = self._build_fundamentals(mode, tool_results)
@@ -104,50 +107,19 @@ class AgentReportFormatter:
         if not isinstance(indicators, dict) or not indicators:
             return "价格样本不足，无法计算趋势与关键位。"
 
-        trend = (
-            indicators.get("trend", {})
-            if isinstance(indicators.get("trend"), dict)
-            else {}
-        )
-        momentum = (
-            indicators.get("momentum", {})
-            if isinstance(indicators.get("momentum"), dict)
-            else {}
-        )
-        volume_price = (
-            indicators.get("volume_price", {})
-            if isinstance(indicators.get("volume_price"), dict)
-            else {}
-        )
-        patterns = (
-            indicators.get("patterns", {})
-            if isinstance(indicators.get("patterns"), dict)
-            else {}
-        )
-        sr = (
-            indicators.get("support_resistance", {})
-            if isinstance(indicators.get("support_resistance"), dict)
-            else {}
-        )
-        strategy = (
-            indicators.get("strategy", {})
-            if isinstance(indicators.get("strategy"), dict)
-            else {}
-        )
+        # Resolve each section once; _dict_at already guarantees a dict, so
+        # the lines below need no further isinstance checks.
+        dict_at = AgentReportFormatter._dict_at
+        fmt = AgentReportFormatter._format_metric
+        trend_primary = dict_at(indicators, "trend", "primary")
+        momentum_primary = dict_at(indicators, "momentum", "primary")
+        volume_primary = dict_at(indicators, "volume_price", "primary")
+        patterns_primary = dict_at(indicators, "patterns", "primary")
+        sr_primary = dict_at(indicators, "support_resistance", "primary")
+        strategy = dict_at(indicators, "strategy")
+        rsi = dict_at(momentum_primary, "rsi")
         as_of = str(indicators.get("as_of") or "N/A")
 
-        trend_primary = trend.get("primary", {}) if isinstance(trend, dict) else {}
-        momentum_primary = (
-            momentum.get("primary", {}) if isinstance(momentum, dict) else {}
-        )
-        volume_primary = (
-            volume_price.get("primary", {}) if isinstance(volume_price, dict) else {}
-        )
-        patterns_primary = (
-            patterns.get("primary", {}) if isinstance(patterns, dict) else {}
-        )
-        sr_primary = sr.get("primary", {}) if isinstance(sr, dict) else {}
-
         supports = AgentReportFormatter._format_levels(sr_primary.get("supports"))
         resistances = AgentReportFormatter._format_levels(sr_primary.get("resistances"))
         recent_patterns = AgentReportFormatter._format_patterns(
@@ -156,29 +128,29 @@ class AgentReportFormatter:
         position_size = AgentReportFormatter._format_percent(
             strategy.get("position_size")
         )
-        entry_zone = AgentReportFormatter._format_metric(strategy.get("entry_zone"))
+        entry_zone = fmt(strategy.get("entry_zone"))
 
         lines = [
             f"数据日期: {as_of}",
             "[趋势]",
             (
-                f"MA 排列: {((trend_primary.get('ma') or {}).get('state') if isinstance(trend_primary, dict) else 'N/A')}; "
-                f"MACD: {((trend_primary.get('macd') or {}).get('cross') if isinstance(trend_primary, dict) else 'N/A')}; "
-                f"布林: {((trend_primary.get('bollinger') or {}).get('status') if isinstance(trend_primary, dict) else 'N/A')}"
+                f"MA 排列: {dict_at(trend_primary, 'ma').get('state')}; "
+                f"MACD: {dict_at(trend_primary, 'macd').get('cross')}; "
+                f"布林: {dict_at(trend_primary, 'bollinger').get('status')}"
             ),
             "[动量]",
             (
-                f"RSI: {AgentReportFormatter._format_metric(((momentum_primary.get('rsi') or {}).get('value') if isinstance(momentum_primary, dict) else None))}; "
-                f"RSI 状态: {((momentum_primary.get('rsi') or {}).get('status') if isinstance(momentum_primary, dict) else 'N/A')}; "
-                f"KDJ: {((momentum_primary.get('kdj') or {}).get('status') if isinstance(momentum_primary, dict) else 'N/A')}; "
-                f"背离: {((momentum_primary.get('divergence') or {}).get('type') if isinstance(momentum_primary, dict) else 'N/A')}"
+                f"RSI: {fmt(rsi.get('value'))}; "
+                f"RSI 状态: {rsi.get('status')}; "
+                f"KDJ: {dict_at(momentum_primary, 'kdj').get('status')}; "
+                f"背离: {dict_at(momentum_primary, 'divergence').get('type')}"
             ),
             "[量价]",
             (
-                f"量比: {AgentReportFormatter._format_metric(volume_primary.get('volume_ratio') if isinstance(volume_primary, dict) else None)}; "
-                f"缩量回调: {AgentReportFormatter._format_metric(volume_primary.get('shrink_pullback') if isinstance(volume_primary, dict) else None)}; "
-                f"放量突破: {AgentReportFormatter._format_metric(volume_primary.get('volume_breakout') if isinstance(volume_primary, dict) else None)}; "
-                f"ATR14: {AgentReportFormatter._format_metric(volume_primary.get('atr_14') if isinstance(volume_primary, dict) else None)}"
+                f"量比: {fmt(volume_primary.get('volume_ratio'))}; "
+                f"缩量回调: {fmt(volume_primary.get('shrink_pullback'))}; "
+                f"放量突破: {fmt(volume_primary.get('volume_breakout'))}; "
+                f"ATR14: {fmt(volume_primary.get('atr_14'))}"
             ),
             "[形态]",
             f"最近形态: {recent_patterns}",
@@ -186,10 +158,10 @@ class AgentReportFormatter:
             f"支撑: {supports}; 压力: {resistances}",
             "[策略级输出]",
             (
-                f"score={AgentReportFormatter._format_metric(strategy.get('score'))}, stance={strategy.get('stance') or 'N/A'}, "
+                f"score={fmt(strategy.get('score'))}, stance={strategy.get('stance') or 'N/A'}, "
                 f"position_size={position_size}, "
-                f"entry_zone={entry_zone}, stop_loss={AgentReportFormatter._format_metric(strategy.get('stop_loss'))}, "
-                f"take_profit={AgentReportFormatter._format_metric(strategy.get('take_profit'))}"
+                f"entry_zone={entry_zone}, stop_loss={fmt(strategy.get('stop_loss'))}, "
+                f"take_profit={fmt(strategy.get('take_profit'))}"
             ),
         ]
         return "\n".join(lines)
@@ -213,183 +185,95 @@ class AgentReportFormatter:
                 header + ["| 技术面 | 指标缺失 | N/A | 价格样本不足，无法计算指标 |"]
             )
 
-        trend = (
-            indicators.get("trend", {})
-            if isinstance(indicators.get("trend"), dict)
-            else {}
-        )
-        momentum = (
-            indicators.get("momentum", {})
-            if isinstance(indicators.get("momentum"), dict)
-            else {}
-        )
-        volume_price = (
-            indicators.get("volume_price", {})
-            if isinstance(indicators.get("volume_price"), dict)
-            else {}
-        )
-        strategy = (
-            indicators.get("strategy", {})
-            if isinstance(indicators.get("strategy"), dict)
-            else {}
-        )
-
-        trend_primary = trend.get("primary", {}) if isinstance(trend, dict) else {}
-        momentum_primary = (
-            momentum.get("primary", {}) if isinstance(momentum, dict) else {}
-        )
-        volume_primary = (
-            volume_price.get("primary", {}) if isinstance(volume_price, dict) else {}
-        )
+        dict_at = AgentReportFormatter._dict_at
+        fmt = AgentReportFormatter._format_metric
+        trend_primary = dict_at(indicators, "trend", "primary")
+        momentum_primary = dict_at(indicators, "momentum", "primary")
+        volume_primary = dict_at(indicators, "volume_price", "primary")
+        strategy = dict_at(indicators, "strategy")
+        rsi = dict_at(momentum_primary, "rsi")
 
         rows = [
             (
                 "趋势",
                 "MA 状态",
-                AgentReportFormatter._format_metric(
-                    (
-                        (trend_primary.get("ma") or {}).get("state")
-                        if isinstance(trend_primary, dict)
-                        else None
-                    )
-                ),
+                fmt(dict_at(trend_primary, "ma").get("state")),
                 "均线排列方向",
             ),
             (
                 "趋势",
                 "MACD",
-                AgentReportFormatter._format_metric(
-                    (
-                        (trend_primary.get("macd") or {}).get("cross")
-                        if isinstance(trend_primary, dict)
-                        else None
-                    )
-                ),
+                fmt(dict_at(trend_primary, "macd").get("cross")),
                 "MACD 交叉状态",
             ),
             (
                 "趋势",
                 "布林状态",
-                AgentReportFormatter._format_metric(
-                    (
-                        (trend_primary.get("bollinger") or {}).get("status")
-                        if isinstance(trend_primary, dict)
-                        else None
-                    )
-                ),
+                fmt(dict_at(trend_primary, "bollinger").get("status")),
                 "价格与布林带关系",
             ),
-            (
-                "动量",
-                "RSI",
-                AgentReportFormatter._format_metric(
-                    (
-                        (momentum_primary.get("rsi") or {}).get("value")
-                        if isinstance(momentum_primary, dict)
-                        else None
-                    )
-                ),
-                AgentReportFormatter._format_metric(
-                    (
-                        (momentum_primary.get("rsi") or {}).get("status")
-                        if isinstance(momentum_primary, dict)
-                        else None
-                    )
-                ),
-            ),
+            ("动量", "RSI", fmt(rsi.get("value")), fmt(rsi.get("status"))),
             (
                 "动量",
                 "KDJ",
-                AgentReportFormatter._format_metric(
-                    (
-                        (momentum_primary.get("kdj") or {}).get("status")
-                        if isinstance(momentum_primary, dict)
-                        else None
-                    )
-                ),
+                fmt(dict_at(momentum_primary, "kdj").get("status")),
                 "KDJ 状态",
             ),
             (
                 "动量",
                 "背离类型",
-                AgentReportFormatter._format_metric(
-                    (
-                        (momentum_primary.get("divergence") or {}).get("type")
-                        if isinstance(momentum_primary, dict)
-                        else None
-                    )
-                ),
+                fmt(dict_at(momentum_primary, "divergence").get("type")),
                 "价格与动量背离",
             ),
-            (
-                "量价",
-                "量比",
-                AgentReportFormatter._format_metric(
-                    volume_primary.get("volume_ratio")
-                    if isinstance(volume_primary, dict)
-                    else None
-                ),
-                "成交量变化",
-            ),
+            ("量价", "量比", fmt(volume_primary.get("volume_ratio")), "成交量变化"),
             (
                 "量价",
                 "放量突破",
-                AgentReportFormatter._format_metric(
-                    volume_primary.get("volume_breakout")
-                    if isinstance(volume_primary, dict)
-                    else None
-                ),
+                fmt(volume_primary.get("volume_breakout")),
                 "放量突破信号",
             ),
-            (
-                "量价",
-                "ATR14",
-                AgentReportFormatter._format_metric(
-                    volume_primary.get("atr_14")
-                    if isinstance(volume_primary, dict)
-                    else None
-                ),
-                "波动幅度",
-            ),
+            ("量价", "ATR14", fmt(volume_primary.get("atr_14")), "波动幅度"),
             (
                 "策略",
                 "Score",
-                AgentReportFormatter._format_metric(strategy.get("score")),
-                AgentReportFormatter._format_metric(strategy.get("stance")),
+                fmt(strategy.get("score")),
+                fmt(strategy.get("stance")),
             ),
             (
                 "策略",
                 "仓位建议",
-                AgentReportFormatter._format_metric(strategy.get("position_size")),
+                fmt(strategy.get("position_size")),
                 "建议仓位(%)",
             ),
             (
                 "策略",
                 "止损/止盈",
-                (
-                    f"{AgentReportFormatter._format_metric(strategy.get('stop_loss'))} / "
-                    f"{AgentReportFormatter._format_metric(strategy.get('take_profit'))}"
-                ),
+                f"{fmt(strategy.get('stop_loss'))} / {fmt(strategy.get('take_profit'))}",
                 "风险收益边界",
             ),
         ]
 
+        escape = AgentReportFormatter._escape_table_cell
         lines = list(header)
         for dimension, metric, value, note in rows:
             lines.append(
                 "| "
                 + " | ".join(
-                    [
-                        AgentReportFormatter._escape_table_cell(dimension),
-                        AgentReportFormatter._escape_table_cell(metric),
-                        AgentReportFormatter._escape_table_cell(value),
-                        AgentReportFormatter._escape_table_cell(note),
-                    ]
+                    [escape(dimension), escape(metric), escape(value), escape(note)]
                 )
                 + " |"
             )
         return "\n".join(lines)
 
+    @staticmethod
+    def _dict_at(payload: Any, *keys: str) -> Dict[str, Any]:
+        """Walk nested keys, yielding {} as soon as a level is not a dict."""
+        for key in keys:
+            if not isinstance(payload, dict):
+                return {}
+            payload = payload.get(key)
+        return payload if isinstance(payload, dict) else {}
+
     @staticmethod
     def _build_risk_action_table(runtime_draft: RuntimeDraft) -> str:
         header = [
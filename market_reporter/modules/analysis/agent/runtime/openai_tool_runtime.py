@@ -4,15 +4,15 @@ import asyncio
 import json
 import logging
 import time
-from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
 from market_reporter.config import AnalysisProviderConfig
-from market_reporter.core.utils import parse_json
+from market_reporter.core.utils import parse_json, utc_now_iso
 from market_reporter.modules.analysis.agent.runtime.payload_normalizer import (
     runtime_draft_from_payload,
 )
@@ -24,6 +24,17 @@ ToolExecutor = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
 logger = logging.getLogger(__name__)
 
 
+def _dumps_tool_result(result: Dict[str, Any]) -> str:
+    # Tool payloads (hundreds of OHLCV bars) are re-serialized for every
+    # model turn; orjson is several times faster than the stdlib encoder and
+    # emits compact UTF-8 like ``ensure_ascii=False``.
+    return orjson.dumps(
+        result,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
+
+
 class OpenAIToolRuntime:
     MAX_RETRIES_PER_TOOL_SIGNATURE = 2
     MAX_MODEL_CALL_RETRIES = 2
@@ -78,6 +89,9 @@ class OpenAIToolRuntime:
         ]
 
         traces: List[ToolCallTrace] = []
+        # Bound once: these run for every tool call of every step.
+        add_trace = traces.append
+        add_message = messages.append
         used_calls = 0
         content_text = ""
         structured: Dict[str, Any] | None = None
@@ -133,12 +147,16 @@ class OpenAIToolRuntime:
                     finish_reason = "tool_budget_exhausted"
                     break
 
-                messages.append(response)
-                budget_exhausted_mid_batch = False
-                for call in tool_calls:
-                    if used_calls >= max_tool_calls:
-                        budget_exhausted_mid_batch = True
-                        break
+                add_message(response)
+                remaining_budget = max(max_tool_calls - used_calls, 0)
+                batch = tool_calls[:remaining_budget]
+                budget_exhausted_mid_batch = len(batch) < len(tool_calls)
+
+                # Tool calls within one model response are independent, so
+                # run them concurrently and record the results in call order.
+                planned: List[Tuple[Dict[str, Any], str, Dict[str, Any], int]] = []
+                pending: List[Awaitable[Tuple[Any, int]]] = []
+                for call in batch:
                     name = str(call.get("name") or "").strip()
                     arguments = call.get("args")
                     if not isinstance(arguments, dict):
@@ -146,6 +164,20 @@ class OpenAIToolRuntime:
 
                     attempt_key = self._tool_attempt_key(name=name, arguments=arguments)
                     seen = tool_attempts.get(attempt_key, 0)
+                    planned.append((call, name, arguments, seen))
+                    if seen >= self.MAX_RETRIES_PER_TOOL_SIGNATURE:
+                        continue
+                    tool_attempts[attempt_key] = seen + 1
+                    pending.append(
+                        self._execute_tool_call(
+                            tool_executor=tool_executor,
+                            name=name,
+                            arguments=arguments,
+                        )
+                    )
+                executed = iter(await asyncio.gather(*pending))
+
+                for call, name, arguments, seen in planned:
                     tool_ms: int | None = None
                     if seen >= self.MAX_RETRIES_PER_TOOL_SIGNATURE:
                         result = self._tool_retry_limit_result(
@@ -154,13 +186,7 @@ class OpenAIToolRuntime:
                             attempts=seen,
                         )
                     else:
-                        tool_attempts[attempt_key] = seen + 1
-                        t_tool_start = time.monotonic()
-                        try:
-                            result = await tool_executor(name, arguments)
-                        except Exception as exc:
-                            result = self._tool_error_result(name=name, exc=exc)
-                        tool_ms = int((time.monotonic() - t_tool_start) * 1000)
+                        result, tool_ms = next(executed)
                     result = self._normalize_tool_result(name=name, result=result)
                     used_calls += 1
                     trace = ToolCallTrace(
@@ -169,16 +195,16 @@ class OpenAIToolRuntime:
                         result_preview=self._preview_result(result),
                         duration_ms=tool_ms,
                     )
-                    traces.append(trace)
+                    add_trace(trace)
                     if on_step is not None:
                         try:
                             await on_step(trace.model_dump())
                         except Exception:
                             pass
                     call_id = str(call.get("id") or f"tool_call_{used_calls}")
-                    messages.append(
+                    add_message(
                         ToolMessage(
-                            content=json.dumps(result, ensure_ascii=False),
+                            content=_dumps_tool_result(result),
                             tool_call_id=call_id,
                         )
                     )
@@ -225,6 +251,19 @@ class OpenAIToolRuntime:
                 pass
         return draft, traces
 
+    async def _execute_tool_call(
+        self,
+        tool_executor: ToolExecutor,
+        name: str,
+        arguments: Dict[str, Any],
+    ) -> Tuple[Any, int]:
+        t_tool_start = time.monotonic()
+        try:
+            result: Any = await tool_executor(name, arguments)
+        except Exception as exc:
+            result = self._tool_error_result(name=name, exc=exc)
+        return result, int((time.monotonic() - t_tool_start) * 1000)
+
     async def _invoke_model_with_retry(
         self,
         llm_with_tools: Any,
@@ -293,7 +332,7 @@ class OpenAIToolRuntime:
 
     @staticmethod
     def _tool_error_result(name: str, exc: Exception) -> Dict[str, Any]:
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        timestamp = utc_now_iso()
         error_type = type(exc).__name__
         warning_code = "tool_execution_error"
         hint = "Inspect tool schema and arguments, then try a corrected call."
@@ -326,7 +365,7 @@ class OpenAIToolRuntime:
         arguments: Dict[str, Any],
         attempts: int,
     ) -> Dict[str, Any]:
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        timestamp = utc_now_iso()
         return {
             "tool": name,
             "status": "error",
@@ -350,7 +389,7 @@ class OpenAIToolRuntime:
     def _normalize_tool_result(name: str, result: Any) -> Dict[str, Any]:
         if isinstance(result, dict):
             return result
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        timestamp = utc_now_iso()
         return {
             "tool": name,
             "status": "error",
@@ -408,12 +447,12 @@ class OpenAIToolRuntime:
         tool_calls: List[Dict[str, Any]],
         max_tool_calls: int,
     ) -> Dict[str, Any]:
-        requested_tools = [
-            str(call.get("name") or "").strip()
-            for call in tool_calls
-            if str(call.get("name") or "").strip()
-        ]
-        deduped_tools = list(dict.fromkeys(requested_tools))
+        requested_tools: Dict[str, None] = {}
+        for call in tool_calls:
+            name = str(call.get("name") or "").strip()
+            if name:
+                requested_tools[name] = None
+        deduped_tools = list(requested_tools)
         summary = (
             f"已达到工具调用上限（{max_tool_calls} 次），"
             "以下报告基于已收集证据自动整理，模型未完成最终结构化归纳。"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # ---------------------------------------------------------------------------
@@ -86,6 +86,13 @@ class AgentRunRequest(BaseModel):
     timeframes: List[str] = Field(default_factory=list)
     indicator_profile: Literal["balanced", "trend", "momentum"] = "balanced"
 
+    @field_validator("indicators")
+    @classmethod
+    def normalize_indicators(cls, value: List[str]) -> List[str]:
+        # Normalize once at the boundary so consumers can use the list as-is.
+        cleaned = (str(item).strip().upper() for item in value)
+        return list(dict.fromkeys(item for item in cleaned if item))
+
 
 class AgentRunResult(BaseModel):
     analysis_input: Dict[str, Any] = Field(default_factory=dict)
@@ -173,25 +173,29 @@ class AgentService:
         bars = metrics_payload.get("bars")
         if not isinstance(bars, list):
             return []
+        # Per-payload fields are the same for every bar; resolve them once.
+        symbol = request.symbol or ""
+        market = request.market or ""
+        interval = str(metrics_payload.get("interval") or "1d")
+        source = str(metrics_payload.get("source") or "")
         rows: list[KLineBar] = []
         for row in bars:
             if not isinstance(row, dict):
                 continue
+            volume = row.get("volume")
             try:
                 rows.append(
                     KLineBar(
-                        symbol=request.symbol or "",
-                        market=request.market or "",
-                        interval=str(metrics_payload.get("interval") or "1d"),
+                        symbol=symbol,
+                        market=market,
+                        interval=interval,
                         ts=str(row.get("ts") or ""),
                         open=float(row.get("open") or 0.0),
                         high=float(row.get("high") or 0.0),
                         low=float(row.get("low") or 0.0),
                         close=float(row.get("close") or 0.0),
-                        volume=float(row.get("volume"))
-                        if row.get("volume") is not None
-                        else None,
-                        source=str(metrics_payload.get("source") or ""),
+                        volume=float(volume) if volume is not None else None,
+                        source=source,
                     )
                 )
             except Exception:
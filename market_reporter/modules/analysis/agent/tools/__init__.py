@@ -1,9 +1,35 @@
-from market_reporter.modules.analysis.agent.tools.builtin_metrics_tool import (
-    BuiltinMetricsTool,
-    get_definition as get_metrics_definition,
-)
-
-__all__ = [
-    "BuiltinMetricsTool",
-    "get_metrics_definition",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from market_reporter.modules.analysis.agent.tools.builtin_metrics_tool import (
+        BuiltinMetricsTool,
+        get_definition as get_metrics_definition,
+    )
+    from market_reporter.modules.analysis.agent.tools.builtin_news_tool import (
+        BuiltinNewsTool,
+        get_definition as get_news_definition,
+    )
+
+# Exported name -> (submodule, attribute).  Tool modules pull in provider SDKs
+# (longbridge, feedparser), so they are only imported on first access.
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "BuiltinMetricsTool": ("builtin_metrics_tool", "BuiltinMetricsTool"),
+    "get_metrics_definition": ("builtin_metrics_tool", "get_definition"),
+    "BuiltinNewsTool": ("builtin_news_tool", "BuiltinNewsTool"),
+    "get_news_definition": ("builtin_news_tool", "get_definition"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{target[0]}")
+    value = getattr(module, target[1])
+    globals()[name] = value
+    return value
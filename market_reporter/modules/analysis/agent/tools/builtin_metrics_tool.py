@@ -7,13 +7,26 @@ raw results from the Longbridge OpenAPI.
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
 from market_reporter.config import LongbridgeConfig
+from market_reporter.core.utils import utc_now_iso
 from market_reporter.modules.analysis.agent.core.tool_protocol import ToolDefinition
+from market_reporter.modules.market_data.lb_context import (
+    LB_PERIOD_NAMES as _PERIOD_NAMES,
+    get_quote_context,
+    is_context_error,
+    reset_quote_context,
+)
 from market_reporter.modules.market_data.symbol_mapper import (
+    infer_market_from_symbol,
     normalize_symbol,
     to_longbridge_symbol,
 )
@@ -22,6 +35,68 @@ logger = logging.getLogger(__name__)
 
 _NAME = "get_metrics"
 
+T = TypeVar("T")
+
+_SUPPORTED_INTERVALS = frozenset(_PERIOD_NAMES)
+
+# static_info payload fields, read straight off the SDK record by name.
+_STATIC_TEXT_FIELDS = ("name_cn", "name_en", "name_hk", "listing_date")
+_STATIC_NUMBER_FIELDS = (
+    "total_shares",
+    "circulating_shares",
+    "eps_ttm",
+    "bps",
+    "dividend_yield",
+)
+# (CalcIndex member name, SDK attribute, payload key) for calc_indexes.
+_CALC_INDEX_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("PeTtmRatio", "pe_ttm_ratio", "trailing_pe"),
+    ("PbRatio", "pb_ratio", "pb_ratio"),
+    ("TotalMarketValue", "total_market_value", "market_cap"),
+    ("DividendRatioTtm", "dividend_ratio_ttm", "dividend_ratio_ttm"),
+    ("TurnoverRate", "turnover_rate", "turnover_rate"),
+    ("VolumeRatio", "volume_ratio", "volume_ratio"),
+)
+
+# The runtime executes a model turn's tool calls concurrently (e.g. several
+# candlestick intervals at once).  Cap in-flight Longbridge requests across
+# all tool instances so a wide batch does not trip the OpenAPI rate limit.
+# Calls queue on a dedicated pool sized to the cap, so waiting requests do not
+# park threads of the loop's default executor.
+_LB_MAX_CONCURRENCY = 4
+_LB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_LB_MAX_CONCURRENCY, thread_name_prefix="longbridge-metrics"
+)
+
+# Company snapshots barely move within a session, and peer comparisons fan out
+# to the same (action, symbol, market) lookups run after run.  Successful
+# results are shared across tool instances in a bounded LRU with a per-action
+# TTL, and concurrent identical lookups await a single in-flight fetch.
+# static_info (names, shares, EPS/BPS) changes with filings; calc_indexes
+# carries price-driven ratios, so it only lives for a few minutes.  Identical
+# candlestick windows recur while the model refines an answer; they are keyed
+# on the normalised window and kept for a minute.  Tools are built per user
+# with that user's Longbridge credentials, so entries are scoped to a digest
+# of them and never cross accounts.
+_SNAPSHOT_TTL_SECONDS: Dict[str, float] = {
+    "static_info": 6 * 3600.0,
+    "calc_indexes": 600.0,
+    "candlesticks": 60.0,
+}
+_SNAPSHOT_ACTIONS = frozenset(_SNAPSHOT_TTL_SECONDS)
+_SNAPSHOT_MAX_ENTRIES = 512
+# (credential scope, action, symbol, market, action-specific variant)
+_SnapshotKey = Tuple[str, str, str, str, str]
+_SNAPSHOT_CACHE: "OrderedDict[_SnapshotKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_SNAPSHOT_INFLIGHT: Dict[_SnapshotKey, "asyncio.Future[Dict[str, Any]]"] = {}
+
+# static_info and calc_indexes both accept a symbol list, and a model turn
+# comparing peers asks for several symbols at once.  Lookups arriving within
+# the window are sent as one request of at most _BATCH_MAX_SYMBOLS symbols.
+_BATCH_WINDOW_SECONDS = 0.005
+_BATCH_MAX_SYMBOLS = 50
+_BATCHED_ACTIONS = frozenset({"static_info", "calc_indexes"})
+
 _SPEC = {
     "type": "object",
     "properties": {
@@ -44,6 +119,14 @@ _SPEC = {
             ],
         },
         "symbol": {"type": "string", "description": "Stock ticker symbol."},
+        "symbols": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                "Additional symbols (for static_info / calc_indexes, e.g. peers). "
+                "All symbols are fetched in one request and returned under results."
+            ),
+        },
         "market": {
             "type": "string",
             "description": "Market: CN, HK, US. Inferred from symbol suffix if omitted.",
@@ -72,17 +155,21 @@ _SPEC = {
 }
 
 
+_DEFINITION = ToolDefinition(
+    name=_NAME,
+    description=(
+        "Fetch stock data via Longbridge OpenAPI. "
+        "Returns raw candlesticks, quotes, company info, calc indexes, "
+        "or intraday curves. The model decides which data types to request."
+    ),
+    parameters=_SPEC,
+    source="builtin",
+    idempotent=True,
+)
+
+
 def get_definition() -> ToolDefinition:
-    return ToolDefinition(
-        name=_NAME,
-        description=(
-            "Fetch stock data via Longbridge OpenAPI. "
-            "Returns raw candlesticks, quotes, company info, calc indexes, "
-            "or intraday curves. The model decides which data types to request."
-        ),
-        parameters=_SPEC,
-        source="builtin",
-    )
+    return _DEFINITION
 
 
 class BuiltinMetricsTool:
@@ -97,6 +184,25 @@ class BuiltinMetricsTool:
             and lb_config.app_secret
             and lb_config.access_token
         )
+        self._cache_scope = _credential_scope(lb_config)
+        # Action -> handler, bound once rather than rebuilt on every call.
+        self._dispatch: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+            "candlesticks": self._candlesticks,
+            "quote": self._quote,
+            "static_info": self._static_info,
+            "calc_indexes": self._calc_indexes,
+            "intraday": self._intraday,
+        }
+        # Per-symbol snapshot lookups issued together are merged into one
+        # multi-symbol SDK request.
+        self._batchers: Dict[str, _SymbolBatcher] = {
+            "static_info": _SymbolBatcher(
+                self, "static_info", "_static_info_sync", "_static_info_many_sync"
+            ),
+            "calc_indexes": _SymbolBatcher(
+                self, "calc_indexes", "_calc_indexes_sync", "_calc_indexes_many_sync"
+            ),
+        }
 
     async def execute(self, **kwargs: Any) -> Dict[str, Any]:
         if not self._enabled:
@@ -108,27 +214,141 @@ class BuiltinMetricsTool:
 
         if not action or not symbol:
             return self._error("action and symbol are required")
-
-        resolved_market = _infer_market(symbol, fallback=market or "US")
-        normalized = normalize_symbol(symbol, resolved_market)
-
-        dispatch = {
-            "candlesticks": self._candlesticks,
-            "quote": self._quote,
-            "static_info": self._static_info,
-            "calc_indexes": self._calc_indexes,
-            "intraday": self._intraday,
-        }
-        handler = dispatch.get(action)
+        handler = self._dispatch.get(action)
         if handler is None:
             return self._error(f"Unknown action: {action}")
 
+        resolved_market = infer_market_from_symbol(symbol, fallback=market or "US")
+        normalized = normalize_symbol(symbol, resolved_market)
+
         try:
+            if action in _BATCHED_ACTIONS and kwargs.get("symbols"):
+                return await self._multi_snapshot(
+                    action, handler, symbol=normalized, market=resolved_market,
+                    kwargs=kwargs,
+                )
+            if action in _SNAPSHOT_ACTIONS:
+                return await self._cached_snapshot(
+                    action, handler, symbol=normalized, market=resolved_market, kwargs=kwargs,
+                )
             return await handler(symbol=normalized, market=resolved_market, kwargs=kwargs)
         except Exception as exc:
+            self._reset_ctx_on(exc)
             logger.exception("get_metrics action=%s failed for %s", action, normalized)
             return self._error(str(exc), action=action, symbol=normalized, market=resolved_market)
 
+    def _ensure_ctx(self) -> Any:
+        """Return the shared QuoteContext (must be called in a thread)."""
+        return get_quote_context(self._lb_config)
+
+    def _reset_ctx_on(self, exc: BaseException) -> None:
+        """Drop the shared context if *exc* suggests its connection is gone."""
+        if is_context_error(exc):
+            reset_quote_context(self._lb_config)
+
+    async def _multi_snapshot(
+        self,
+        action: str,
+        handler: Any,
+        symbol: str,
+        market: str,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        targets: List[Tuple[str, str]] = [(symbol, market)]
+        raw_symbols = kwargs.get("symbols")
+        if isinstance(raw_symbols, str):
+            raw_symbols = [raw_symbols]
+        for raw in raw_symbols or []:
+            text = str(raw or "").strip()
+            if not text:
+                continue
+            extra_market = infer_market_from_symbol(text, fallback=market)
+            target = (normalize_symbol(text, extra_market), extra_market)
+            if target not in targets:
+                targets.append(target)
+        targets = targets[:_BATCH_MAX_SYMBOLS]
+
+        # Each lookup still goes through the snapshot cache; the misses land
+        # in the same batcher window and share one multi-symbol request.
+        payloads = await asyncio.gather(
+            *[
+                self._cached_snapshot(
+                    action, handler, symbol=item_symbol, market=item_market,
+                    kwargs=kwargs,
+                )
+                for item_symbol, item_market in targets
+            ]
+        )
+        retrieved_at = utc_now_iso()
+        return {
+            "action": action,
+            "symbol": symbol,
+            "market": market,
+            "results": list(payloads),
+            "as_of": retrieved_at,
+            "source": "longbridge",
+            "retrieved_at": retrieved_at,
+            "warnings": [
+                f"{payload['symbol']}:{warning}"
+                for payload in payloads
+                for warning in payload.get("warnings") or []
+            ],
+        }
+
+    async def _cached_snapshot(
+        self,
+        action: str,
+        handler: Any,
+        symbol: str,
+        market: str,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        variant = ""
+        if action == "candlesticks":
+            variant = "|".join(str(part) for part in _candlestick_params(kwargs))
+        key = (self._cache_scope, action, symbol, market, variant)
+        cached = _SNAPSHOT_CACHE.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < _SNAPSHOT_TTL_SECONDS[action]:
+                _SNAPSHOT_CACHE.move_to_end(key)
+                return copy.deepcopy(cached[1])
+            del _SNAPSHOT_CACHE[key]
+
+        inflight = _SNAPSHOT_INFLIGHT.get(key)
+        if inflight is not None:
+            try:
+                return copy.deepcopy(await asyncio.shield(inflight))
+            except _LeaderCancelled:
+                # The fetching call was cancelled, not this one; fetch again.
+                return await self._cached_snapshot(
+                    action, handler, symbol=symbol, market=market, kwargs=kwargs,
+                )
+
+        future: asyncio.Future[Dict[str, Any]] = asyncio.get_running_loop().create_future()
+        _SNAPSHOT_INFLIGHT[key] = future
+        try:
+            payload = await handler(symbol=symbol, market=market, kwargs=kwargs)
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an un-awaited future does not log noise.
+            future.exception()
+            raise
+        except BaseException:
+            # Followers were not cancelled themselves; tell them to retry.
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        else:
+            future.set_result(payload)
+            if not payload.get("warnings"):
+                _SNAPSHOT_CACHE[key] = (time.monotonic(), copy.deepcopy(payload))
+                _SNAPSHOT_CACHE.move_to_end(key)
+                while len(_SNAPSHOT_CACHE) > _SNAPSHOT_MAX_ENTRIES:
+                    _SNAPSHOT_CACHE.popitem(last=False)
+            return payload
+        finally:
+            _SNAPSHOT_INFLIGHT.pop(key, None)
+
     # ------------------------------------------------------------------
     # candlesticks
     # ------------------------------------------------------------------
@@ -136,11 +356,8 @@ class BuiltinMetricsTool:
     async def _candlesticks(
         self, symbol: str, market: str, kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        interval = str(kwargs.get("interval") or "1d").strip()
-        count = min(int(kwargs.get("count") or 200), 500)
-        start = str(kwargs.get("start") or "").strip()
-        end = str(kwargs.get("end") or "").strip()
-        return await asyncio.to_thread(
+        interval, count, start, end = _candlestick_params(kwargs)
+        return await _to_thread_limited(
             self._candlesticks_sync, symbol, market, interval, count, start, end,
         )
 
@@ -153,16 +370,11 @@ class BuiltinMetricsTool:
         start: str,
         end: str,
     ) -> Dict[str, Any]:
-        from longbridge.openapi import AdjustType, Config, Period, QuoteContext
+        from longbridge.openapi import AdjustType
 
         lb_symbol = to_longbridge_symbol(symbol, market)
         period = _map_period(interval)
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        ctx = QuoteContext(config)
+        ctx = self._ensure_ctx()
 
         try:
             from datetime import date as date_cls
@@ -190,7 +402,7 @@ class BuiltinMetricsTool:
                 "volume": float(c.volume) if c.volume is not None else None,
             })
 
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        retrieved_at = utc_now_iso()
         as_of = bars[-1]["ts"] if bars else retrieved_at
         return {
             "action": "candlesticks",
@@ -212,18 +424,11 @@ class BuiltinMetricsTool:
     async def _quote(
         self, symbol: str, market: str, kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        return await asyncio.to_thread(self._quote_sync, symbol, market)
+        return await _to_thread_limited(self._quote_sync, symbol, market)
 
     def _quote_sync(self, symbol: str, market: str) -> Dict[str, Any]:
-        from longbridge.openapi import Config, QuoteContext
-
         lb_symbol = to_longbridge_symbol(symbol, market)
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        ctx = QuoteContext(config)
+        ctx = self._ensure_ctx()
         quote_rows = ctx.quote([lb_symbol])
         if not quote_rows:
             return self._empty("quote", symbol, market, ["no_quote_data"])
@@ -238,16 +443,13 @@ class BuiltinMetricsTool:
             change = price - prev_close
             change_percent = change / prev_close * 100
 
+        # One clock read serves both the fallback as_of and retrieved_at.
+        retrieved_at = utc_now_iso()
         ts_raw = getattr(row, "timestamp", None)
-        ts = (
-            ts_raw.isoformat(timespec="seconds")
-            if ts_raw
-            else datetime.now(timezone.utc).isoformat(timespec="seconds")
-        )
+        ts = ts_raw.isoformat(timespec="seconds") if ts_raw else retrieved_at
         volume_raw = getattr(row, "volume", None)
         volume = float(volume_raw) if volume_raw is not None else None
 
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
         return {
             "action": "quote",
             "symbol": symbol,
@@ -270,48 +472,48 @@ class BuiltinMetricsTool:
     async def _static_info(
         self, symbol: str, market: str, kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        return await asyncio.to_thread(self._static_info_sync, symbol, market)
+        return await self._batchers["static_info"].fetch(symbol, market)
 
     def _static_info_sync(self, symbol: str, market: str) -> Dict[str, Any]:
-        from longbridge.openapi import Config, QuoteContext
+        return self._static_info_many_sync([(symbol, market)])[0]
 
-        lb_symbol = to_longbridge_symbol(symbol, market)
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        ctx = QuoteContext(config)
-
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
-        warnings: List[str] = []
-        info: Dict[str, Any] = {"symbol": symbol, "market": market}
-
-        static_list = ctx.static_info([lb_symbol])
-        if static_list:
-            si = static_list[0]
-            info["name_cn"] = str(getattr(si, "name_cn", "") or "")
-            info["name_en"] = str(getattr(si, "name_en", "") or "")
-            info["name_hk"] = str(getattr(si, "name_hk", "") or "")
-            info["listing_date"] = str(getattr(si, "listing_date", "") or "")
-            info["total_shares"] = _safe_float(getattr(si, "total_shares", None))
-            info["circulating_shares"] = _safe_float(getattr(si, "circulating_shares", None))
-            info["eps_ttm"] = _safe_float(getattr(si, "eps_ttm", None))
-            info["bps"] = _safe_float(getattr(si, "bps", None))
-            info["dividend_yield"] = _safe_float(getattr(si, "dividend_yield", None))
-        else:
-            warnings.append("empty_static_info")
+    def _static_info_many_sync(
+        self, items: List[Tuple[str, str]],
+    ) -> List[Dict[str, Any]]:
+        lb_symbols = [to_longbridge_symbol(symbol, market) for symbol, market in items]
+        ctx = self._ensure_ctx()
 
-        return {
-            "action": "static_info",
-            "symbol": symbol,
-            "market": market,
-            "info": info,
-            "as_of": retrieved_at,
-            "source": "longbridge",
-            "retrieved_at": retrieved_at,
-            "warnings": warnings,
-        }
+        retrieved_at = utc_now_iso()
+        shared_warnings: List[str] = []
+        records: List[Any] = [None] * len(items)
+        try:
+            records = _pair_records(lb_symbols, ctx.static_info(lb_symbols))
+        except Exception as exc:
+            self._reset_ctx_on(exc)
+            shared_warnings.append(f"static_info_failed:{exc}")
+
+        payloads: List[Dict[str, Any]] = []
+        for (symbol, market), si in zip(items, records):
+            warnings = list(shared_warnings)
+            info: Dict[str, Any] = {"symbol": symbol, "market": market}
+            if si is not None:
+                for name in _STATIC_TEXT_FIELDS:
+                    info[name] = str(getattr(si, name, "") or "")
+                for name in _STATIC_NUMBER_FIELDS:
+                    info[name] = _safe_float(getattr(si, name, None))
+            elif not shared_warnings:
+                warnings.append("empty_static_info")
+            payloads.append({
+                "action": "static_info",
+                "symbol": symbol,
+                "market": market,
+                "info": info,
+                "as_of": retrieved_at,
+                "source": "longbridge",
+                "retrieved_at": retrieved_at,
+                "warnings": warnings,
+            })
+        return payloads
 
     # ------------------------------------------------------------------
     # calc_indexes
@@ -320,57 +522,53 @@ class BuiltinMetricsTool:
     async def _calc_indexes(
         self, symbol: str, market: str, kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        return await asyncio.to_thread(self._calc_indexes_sync, symbol, market)
+        return await self._batchers["calc_indexes"].fetch(symbol, market)
 
     def _calc_indexes_sync(self, symbol: str, market: str) -> Dict[str, Any]:
-        from longbridge.openapi import CalcIndex, Config, QuoteContext
-
-        lb_symbol = to_longbridge_symbol(symbol, market)
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        ctx = QuoteContext(config)
-
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
-        warnings: List[str] = []
-        metrics: Dict[str, Optional[float]] = {}
-
+        return self._calc_indexes_many_sync([(symbol, market)])[0]
+
+    def _calc_indexes_many_sync(
+        self, items: List[Tuple[str, str]],
+    ) -> List[Dict[str, Any]]:
+        calc_indexes = _calc_index_members()
+        lb_symbols = [to_longbridge_symbol(symbol, market) for symbol, market in items]
+        ctx = self._ensure_ctx()
+
+        retrieved_at = utc_now_iso()
+        shared_warnings: List[str] = []
+        records: List[Any] = [None] * len(items)
         try:
-            calc_indexes = [
-                CalcIndex.PeTtmRatio,
-                CalcIndex.PbRatio,
-                CalcIndex.TotalMarketValue,
-                CalcIndex.DividendRatioTtm,
-                CalcIndex.TurnoverRate,
-                CalcIndex.VolumeRatio,
-            ]
-            calc_list = ctx.calc_indexes([lb_symbol], calc_indexes)
-            if calc_list:
-                ci = calc_list[0]
-                metrics["trailing_pe"] = _safe_float(getattr(ci, "pe_ttm_ratio", None))
-                metrics["pb_ratio"] = _safe_float(getattr(ci, "pb_ratio", None))
-                metrics["market_cap"] = _safe_float(getattr(ci, "total_market_value", None))
-                metrics["dividend_ratio_ttm"] = _safe_float(getattr(ci, "dividend_ratio_ttm", None))
-                metrics["turnover_rate"] = _safe_float(getattr(ci, "turnover_rate", None))
-                metrics["volume_ratio"] = _safe_float(getattr(ci, "volume_ratio", None))
+            records = _pair_records(
+                lb_symbols, ctx.calc_indexes(lb_symbols, list(calc_indexes))
+            )
         except Exception as exc:
-            warnings.append(f"calc_indexes_failed:{exc}")
-
-        if not any(v is not None for v in metrics.values()):
-            warnings.append("empty_calc_indexes")
-
-        return {
-            "action": "calc_indexes",
-            "symbol": symbol,
-            "market": market,
-            "metrics": metrics,
-            "as_of": retrieved_at,
-            "source": "longbridge",
-            "retrieved_at": retrieved_at,
-            "warnings": warnings,
-        }
+            self._reset_ctx_on(exc)
+            shared_warnings.append(f"calc_indexes_failed:{exc}")
+
+        payloads: List[Dict[str, Any]] = []
+        for (symbol, market), ci in zip(items, records):
+            warnings = list(shared_warnings)
+            metrics: Dict[str, Optional[float]] = {}
+            populated = 0
+            if ci is not None:
+                for _, attr, key in _CALC_INDEX_FIELDS:
+                    value = _safe_float(getattr(ci, attr, None))
+                    metrics[key] = value
+                    if value is not None:
+                        populated += 1
+            if not populated:
+                warnings.append("empty_calc_indexes")
+            payloads.append({
+                "action": "calc_indexes",
+                "symbol": symbol,
+                "market": market,
+                "metrics": metrics,
+                "as_of": retrieved_at,
+                "source": "longbridge",
+                "retrieved_at": retrieved_at,
+                "warnings": warnings,
+            })
+        return payloads
 
     # ------------------------------------------------------------------
     # intraday
@@ -379,18 +577,11 @@ class BuiltinMetricsTool:
     async def _intraday(
         self, symbol: str, market: str, kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        return await asyncio.to_thread(self._intraday_sync, symbol, market)
+        return await _to_thread_limited(self._intraday_sync, symbol, market)
 
     def _intraday_sync(self, symbol: str, market: str) -> Dict[str, Any]:
-        from longbridge.openapi import Config, QuoteContext
-
         lb_symbol = to_longbridge_symbol(symbol, market)
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        ctx = QuoteContext(config)
+        ctx = self._ensure_ctx()
 
         intraday = ctx.intraday(lb_symbol)
         points: List[Dict[str, Any]] = []
@@ -402,7 +593,7 @@ class BuiltinMetricsTool:
                 "volume": float(line.volume) if line.volume is not None else None,
             })
 
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        retrieved_at = utc_now_iso()
         return {
             "action": "intraday",
             "symbol": symbol,
@@ -425,7 +616,7 @@ class BuiltinMetricsTool:
         symbol: str = "",
         market: str = "",
     ) -> Dict[str, Any]:
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        retrieved_at = utc_now_iso()
         return {
             "action": action,
             "symbol": symbol,
@@ -440,7 +631,7 @@ class BuiltinMetricsTool:
     def _empty(
         action: str, symbol: str, market: str, warnings: List[str],
     ) -> Dict[str, Any]:
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        retrieved_at = utc_now_iso()
         return {
             "action": action,
             "symbol": symbol,
@@ -456,29 +647,143 @@ class BuiltinMetricsTool:
 # Module-level helpers
 # ------------------------------------------------------------------
 
+def _credential_scope(lb_config: Optional[LongbridgeConfig]) -> str:
+    """Digest of the Longbridge credentials, used to partition shared caches."""
+    if lb_config is None:
+        return ""
+    raw = "\0".join(
+        (lb_config.app_key, lb_config.app_secret, lb_config.access_token)
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _LeaderCancelled(Exception):
+    """The call fetching a shared snapshot was cancelled before finishing."""
+
+
+class _SymbolBatcher:
+    """Coalesce concurrent single-symbol lookups into one multi-symbol call.
+
+    A lone lookup still goes through the owner's *fetch_one* method; two or
+    more pending lookups are flushed together through *fetch_many*, which
+    returns one payload per ``(symbol, market)`` item in order.  Methods are
+    looked up by name at flush time.  A failed flush resolves every caller
+    with its own ``error:`` payload, so no waiter is left hanging.
+    """
+
+    def __init__(
+        self, owner: Any, action: str, fetch_one: str, fetch_many: str,
+    ) -> None:
+        self._owner = owner
+        self._action = action
+        self._fetch_one = fetch_one
+        self._fetch_many = fetch_many
+        self._pending: List[Tuple[str, str, "asyncio.Future[Dict[str, Any]]"]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def fetch(self, symbol: str, market: str) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Dict[str, Any]] = loop.create_future()
+        self._pending.append((symbol, market, future))
+        if len(self._pending) >= _BATCH_MAX_SYMBOLS:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(_BATCH_WINDOW_SECONDS, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, batch: List[Tuple[str, str, "asyncio.Future[Dict[str, Any]]"]],
+    ) -> None:
+        try:
+            if len(batch) == 1:
+                symbol, market, _ = batch[0]
+                fetch_one = getattr(self._owner, self._fetch_one)
+                payloads = [await _to_thread_limited(fetch_one, symbol, market)]
+            else:
+                fetch_many = getattr(self._owner, self._fetch_many)
+                items = [(symbol, market) for symbol, market, _ in batch]
+                payloads = await _to_thread_limited(fetch_many, items)
+            for (_, _, future), payload in zip(batch, payloads):
+                if not future.done():
+                    future.set_result(payload)
+        except Exception as exc:
+            self._owner._reset_ctx_on(exc)
+            logger.warning(
+                "get_metrics %s batch of %d failed: %s", self._action, len(batch), exc
+            )
+            self._resolve_with_error(batch, str(exc))
+        finally:
+            # Cancellation (or a short payload list) must not strand waiters.
+            self._resolve_with_error(batch, "batch lookup did not complete")
+
+    def _resolve_with_error(
+        self,
+        batch: List[Tuple[str, str, "asyncio.Future[Dict[str, Any]]"]],
+        message: str,
+    ) -> None:
+        for symbol, market, future in batch:
+            if not future.done():
+                future.set_result(
+                    self._owner._error(
+                        message, action=self._action, symbol=symbol, market=market
+                    )
+                )
+
+
+async def _to_thread_limited(fn: Callable[..., T], *args: Any) -> T:
+    return await asyncio.get_running_loop().run_in_executor(_LB_EXECUTOR, fn, *args)
+
+
+def _candlestick_params(kwargs: Dict[str, Any]) -> Tuple[str, int, str, str]:
+    interval = str(kwargs.get("interval") or "1d").strip()
+    if interval not in _SUPPORTED_INTERVALS:
+        # Unknown intervals fetch daily bars; label the payload to match.
+        interval = "1d"
+    count = min(int(kwargs.get("count") or 200), 500)
+    start = str(kwargs.get("start") or "").strip()
+    end = str(kwargs.get("end") or "").strip()
+    return interval, count, start, end
+
+
+# The SDK stays a lazy import so loading the tool does not pull it in, but the
+# enum lookups below are resolved once rather than re-imported on every call.
+@lru_cache(maxsize=16)
 def _map_period(interval: str):
     from longbridge.openapi import Period
 
-    mapping = {
-        "1m": Period.Min_1,
-        "5m": Period.Min_5,
-        "15m": Period.Min_15,
-        "30m": Period.Min_30,
-        "60m": Period.Min_60,
-        "1d": Period.Day,
-        "1w": Period.Week,
-        "1M": Period.Month,
-    }
-    return mapping.get(interval, Period.Day)
-
-
-def _infer_market(symbol: str, fallback: str = "US") -> str:
-    raw = (symbol or "").strip().upper()
-    if raw.endswith(".HK"):
-        return "HK"
-    if raw.endswith((".SH", ".SZ", ".BJ")):
-        return "CN"
-    return fallback.upper() if fallback else "US"
+    return getattr(Period, _PERIOD_NAMES.get(interval, "Day"))
+
+
+@lru_cache(maxsize=1)
+def _calc_index_members() -> Tuple[Any, ...]:
+    from longbridge.openapi import CalcIndex
+
+    return tuple(getattr(CalcIndex, member) for member, _, _ in _CALC_INDEX_FIELDS)
+
+
+def _pair_records(lb_symbols: List[str], records: Any) -> List[Any]:
+    """Line SDK records up with the requested symbols (None when missing)."""
+    records = list(records or [])
+    by_symbol: Dict[str, Any] = {}
+    for record in records:
+        key = str(getattr(record, "symbol", "") or "").upper()
+        if key:
+            by_symbol.setdefault(key, record)
+    if not by_symbol and len(records) == len(lb_symbols):
+        return records
+    return [by_symbol.get(symbol.upper()) for symbol in lb_symbols]
 
 
 def _safe_float(value: Any) -> Optional[float]:
@@ -3,8 +3,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from datetime import datetime, time, timezone
+from collections import OrderedDict
+from datetime import date, datetime, time, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from time import monotonic
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus, urlparse
 
@@ -12,8 +15,11 @@ import feedparser
 
 from market_reporter.config import LongbridgeConfig
 from market_reporter.core.types import NewsItem
+from market_reporter.core.utils import utc_now_iso
 from market_reporter.modules.analysis.agent.core.tool_protocol import ToolDefinition
+from market_reporter.modules.market_data.lb_context import get_quote_context
 from market_reporter.modules.market_data.symbol_mapper import (
+    infer_market_from_symbol,
     normalize_symbol,
     strip_market_suffix,
     to_longbridge_symbol,
@@ -23,16 +29,37 @@ from market_reporter.modules.news.service import NewsService
 logger = logging.getLogger(__name__)
 
 _NAME = "search_news"
+# Sort key for undated headlines so they land after every dated one.
+_UNDATED = datetime.min.replace(tzinfo=timezone.utc)
+
+# Company names from Longbridge static_info change at most with a rename, yet
+# every symbol search needs them.  Successful lookups are shared across tool
+# instances in a bounded LRU with a TTL; failures are not cached.
+_ALIAS_TTL_SECONDS = 6 * 3600.0
+_ALIAS_MAX_ENTRIES = 512
+_ALIAS_CACHE: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+
+_BING_RSS_URL = "https://www.bing.com/search?q={query}&format=rss"
+
+
+@lru_cache(maxsize=2048)
+def _parse_date_text(text: str) -> Optional[datetime]:
+    # Feeds and repeated searches keep passing the same date strings, and the
+    # parsed datetimes are immutable, so results are shared across calls.
+    # ISO-8601 (web results, range bounds) is parsed in C, so try it
+    # before the pure-Python RFC 2822 parser that RSS dates need.
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except Exception:
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
 
 
-def _infer_market_from_symbol(symbol: str, fallback: str = "US") -> str:
-    raw = (symbol or "").strip().upper()
-    if raw.endswith(".HK"):
-        return "HK"
-    if raw.endswith(".SH") or raw.endswith(".SZ") or raw.endswith(".BJ"):
-        return "CN"
-    return fallback.upper() if fallback else "US"
-
 _SPEC = {
     "type": "object",
     "properties": {
@@ -62,24 +89,32 @@ _SPEC = {
         },
         "include_web": {
             "type": "boolean",
-            "description": "Whether to include web search results from Bing.",
+            "description": (
+                "Whether to include web search results from Bing. "
+                "Defaults to true when a query is given and false for "
+                "symbol-only searches."
+            ),
         },
     },
     "required": ["query"],
 }
 
 
+_DEFINITION = ToolDefinition(
+    name=_NAME,
+    description=(
+        "Search news articles and web results. "
+        "When a symbol is provided, filters news related to that stock. "
+        "When include_web is true, also searches Bing for additional context."
+    ),
+    parameters=_SPEC,
+    source="builtin",
+    idempotent=True,
+)
+
+
 def get_definition() -> ToolDefinition:
-    return ToolDefinition(
-        name=_NAME,
-        description=(
-            "Search news articles and web results. "
-            "When a symbol is provided, filters news related to that stock. "
-            "When include_web is true, also searches Bing for additional context."
-        ),
-        parameters=_SPEC,
-        source="builtin",
-    )
+    return _DEFINITION
 
 
 class BuiltinNewsTool:
@@ -92,7 +127,9 @@ class BuiltinNewsTool:
     ) -> None:
         self.news_service = news_service
         self._lb_config = lb_config
-        self._alias_cache: Dict[str, List[str]] = {}
+        self._collect_inflight: Dict[
+            int, "asyncio.Task[Tuple[List[NewsItem], List[str]]]"
+        ] = {}
 
     async def execute(self, **kwargs: Any) -> Dict[str, Any]:
         query = str(kwargs.get("query") or "").strip()
@@ -101,57 +138,43 @@ class BuiltinNewsTool:
         from_date = str(kwargs.get("from_date") or "").strip()
         to_date = str(kwargs.get("to_date") or "").strip()
         limit = int(kwargs.get("limit") or 50)
-        include_web = bool(kwargs.get("include_web", True))
+        # A bare-symbol web search mostly repeats the symbol-filtered RSS
+        # lookup, so Bing is only on by default when there is a query; an
+        # explicit include_web is always honoured.
+        include_web_arg = kwargs.get("include_web")
+        include_web = bool(query) if include_web_arg is None else bool(include_web_arg)
 
         if not query and not symbol:
             return self._empty_result(query or symbol, warnings=["empty_query"])
 
         resolved_query = query or symbol
 
-        # RSS news search (skip if no news_service)
-        rss_items: List[Dict[str, Any]] = []
-        warnings: List[str] = []
-        if self.news_service is not None:
-            news_items, news_warnings = await self.news_service.collect(limit=max(limit, 100))
-            from_dt = self._parse_range_start(from_date)
-            to_dt = self._parse_range_end(to_date)
-            filtered = self._apply_date_filter(items=news_items, from_dt=from_dt, to_dt=to_dt)
-
-            if symbol:
-                selected_rows, strict_hit = await self._search_stock_news(
-                    filtered_items=filtered,
-                    query=resolved_query,
-                    symbol=symbol,
-                    market=market,
-                    limit=limit,
-                )
-            else:
-                words = [token for token in resolved_query.lower().split() if token]
-                selected_rows = [
-                    row for row, _ in filtered if self._match_query_words(row, words)
-                ]
-                strict_hit = bool(selected_rows)
-
-            rss_items = self._to_search_items(rows=selected_rows, limit=limit)
-            warnings = list(news_warnings)
-            if not strict_hit:
-                warnings.append("no_news_matched")
-        else:
-            warnings.append("rss_unavailable")
-
-        # Optional web search
+        rss_search = self._search_rss(
+            query=resolved_query,
+            symbol=symbol,
+            market=market,
+            from_date=from_date,
+            to_date=to_date,
+            limit=limit,
+        )
         web_items: List[Dict[str, Any]] = []
         if include_web:
-            web_items = await self._search_web_sync(
-                query=resolved_query,
-                limit=min(limit, 12),
-                from_date=from_date,
-                to_date=to_date,
+            # RSS and web search are independent; fetch them concurrently.
+            (rss_items, warnings), web_items = await asyncio.gather(
+                rss_search,
+                self._search_web_sync(
+                    query=resolved_query,
+                    limit=min(limit, 12),
+                    from_date=from_date,
+                    to_date=to_date,
+                ),
             )
             if not web_items:
                 warnings.append("no_web_results")
+        else:
+            rss_items, warnings = await rss_search
 
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        retrieved_at = utc_now_iso()
         as_of = rss_items[0]["published_at"] if rss_items else retrieved_at
 
         return {
@@ -163,24 +186,79 @@ class BuiltinNewsTool:
             "as_of": as_of,
             "source": "rss+bing",
             "retrieved_at": retrieved_at,
-            "warnings": list(dict.fromkeys(warnings)),
+            "warnings": warnings,
         }
 
     # ------------------------------------------------------------------
     # RSS news helpers (from old NewsTools)
     # ------------------------------------------------------------------
 
-    async def _search_stock_news(
+    async def _search_rss(
         self,
-        filtered_items: List[Tuple[NewsItem, Optional[datetime]]],
         query: str,
         symbol: str,
         market: str,
+        from_date: str,
+        to_date: str,
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        if self.news_service is None:
+            return [], ["rss_unavailable"]
+
+        if symbol:
+            # The company-alias lookup is a separate Longbridge round-trip;
+            # overlap it with the feed collect instead of waiting for both.
+            (news_items, news_warnings), (ticker_terms, name_terms) = (
+                await asyncio.gather(
+                    self._collect_news(limit=max(limit, 100)),
+                    self._build_stock_terms(query=query, symbol=symbol, market=market),
+                )
+            )
+        else:
+            news_items, news_warnings = await self._collect_news(limit=max(limit, 100))
+        from_dt = self._parse_range_start(from_date)
+        to_dt = self._parse_range_end(to_date)
+        filtered = self._apply_date_filter(items=news_items, from_dt=from_dt, to_dt=to_dt)
+
+        if symbol:
+            selected_rows, strict_hit = self._search_stock_news(
+                filtered_items=filtered,
+                ticker_terms=ticker_terms,
+                name_terms=name_terms,
+                limit=limit,
+            )
+        else:
+            words = [token for token in query.lower().split() if token]
+            selected_rows = [
+                row for row, _ in filtered if self._match_query_words(row, words)
+            ]
+            strict_hit = bool(selected_rows)
+
+        rss_items = self._to_search_items(rows=selected_rows, limit=limit)
+        # Provider warnings are the only source of repeats; the codes
+        # appended by the caller are distinct, so dedupe once at ingest.
+        warnings = list(dict.fromkeys(news_warnings))
+        if not strict_hit:
+            warnings.append("no_news_matched")
+        return rss_items, warnings
+
+    async def _collect_news(self, limit: int) -> Tuple[List[NewsItem], List[str]]:
+        # Every search filters the same feed snapshot locally, so concurrent
+        # queries share one upstream collect instead of refetching all feeds.
+        task = self._collect_inflight.get(limit)
+        if task is None:
+            task = asyncio.ensure_future(self.news_service.collect(limit=limit))
+            self._collect_inflight[limit] = task
+            task.add_done_callback(lambda _: self._collect_inflight.pop(limit, None))
+        return await asyncio.shield(task)
+
+    def _search_stock_news(
+        self,
+        filtered_items: List[Tuple[NewsItem, Optional[datetime]]],
+        ticker_terms: List[str],
+        name_terms: List[str],
         limit: int,
     ) -> Tuple[List[NewsItem], bool]:
-        ticker_terms, name_terms = await self._build_stock_terms(
-            query=query, symbol=symbol, market=market,
-        )
         strict_rows = [
             row
             for row, _ in filtered_items
@@ -199,7 +277,7 @@ class BuiltinNewsTool:
         query_text = (query or "").strip()
         symbol_text = (symbol or "").strip()
         resolved_symbol = symbol_text or query_text
-        resolved_market = _infer_market_from_symbol(
+        resolved_market = infer_market_from_symbol(
             resolved_symbol, fallback=market or "US",
         )
         normalized_symbol = (
@@ -239,9 +317,12 @@ class BuiltinNewsTool:
             return []
         resolved_market = (market or "US").strip().upper() or "US"
         cache_key = f"{normalized_symbol}:{resolved_market}"
-        cached = self._alias_cache.get(cache_key)
+        cached = _ALIAS_CACHE.get(cache_key)
         if cached is not None:
-            return list(cached)
+            if monotonic() - cached[0] < _ALIAS_TTL_SECONDS:
+                _ALIAS_CACHE.move_to_end(cache_key)
+                return list(cached[1])
+            del _ALIAS_CACHE[cache_key]
 
         if not (
             self._lb_config
@@ -259,21 +340,17 @@ class BuiltinNewsTool:
             )
         except Exception as exc:
             logger.warning("Longbridge company aliases failed for %s: %s", normalized_symbol, exc)
-            aliases = []
+            return []
 
-        self._alias_cache[cache_key] = list(aliases)
+        _ALIAS_CACHE[cache_key] = (monotonic(), list(aliases))
+        _ALIAS_CACHE.move_to_end(cache_key)
+        while len(_ALIAS_CACHE) > _ALIAS_MAX_ENTRIES:
+            _ALIAS_CACHE.popitem(last=False)
         return aliases
 
     def _load_company_aliases_longbridge(self, symbol: str, market: str) -> List[str]:
-        from longbridge.openapi import Config, QuoteContext
-
         assert self._lb_config is not None
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        ctx = QuoteContext(config)
+        ctx = get_quote_context(self._lb_config)
         lb_symbol = to_longbridge_symbol(symbol, market)
         static_list = ctx.static_info([lb_symbol])
         if not static_list:
@@ -297,29 +374,52 @@ class BuiltinNewsTool:
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
+        q = (query or "").strip()
+        if not q:
+            return []
+        url = _BING_RSS_URL.format(query=quote_plus(q))
+        client = getattr(self.news_service, "client", None)
+        if client is not None:
+            # Fetch on the shared async HTTP client instead of parking a
+            # worker thread on feedparser's blocking urllib download.
+            try:
+                body = await client.get_text(url)
+            except RuntimeError:
+                # Client used outside its ``async with`` block.
+                body = None
+            except Exception:
+                return []
+            if body is not None:
+                try:
+                    entries = list(feedparser.parse(body).entries or [])
+                except Exception:
+                    return []
+                return self._web_items(entries, limit, from_date, to_date)
         return await asyncio.to_thread(
-            self._do_web_search, query, limit, from_date, to_date,
+            self._do_web_search, url, limit, from_date, to_date,
         )
 
     def _do_web_search(
         self,
-        query: str,
+        url: str,
         limit: int,
         from_date: Optional[str],
         to_date: Optional[str],
     ) -> List[Dict[str, Any]]:
-        q = (query or "").strip()
-        if not q:
-            return []
-
-        entries = []
         try:
-            url = f"https://www.bing.com/search?q={quote_plus(q)}&format=rss"
             feed = feedparser.parse(url)
             entries = list(feed.entries or [])
         except Exception:
             return []
+        return self._web_items(entries, limit, from_date, to_date)
 
+    def _web_items(
+        self,
+        entries: List[Any],
+        limit: int,
+        from_date: Optional[str],
+        to_date: Optional[str],
+    ) -> List[Dict[str, Any]]:
         from_dt = self._parse_range_start(from_date)
         to_dt = self._parse_range_end(to_date)
         items: List[Dict[str, Any]] = []
@@ -398,7 +498,7 @@ class BuiltinNewsTool:
     ) -> List[NewsItem]:
         sorted_items = sorted(
             filtered_items,
-            key=lambda item: item[1] or datetime.min.replace(tzinfo=timezone.utc),
+            key=lambda item: item[1] or _UNDATED,
             reverse=True,
         )
         return [row for row, _ in sorted_items]
@@ -471,6 +571,15 @@ class BuiltinNewsTool:
 
     @staticmethod
     def _entry_published(entry: object) -> Optional[datetime]:
+        # feedparser already parsed the date into a UTC struct_time; reuse it
+        # rather than parsing the raw string a second time.
+        for attr in ("published_parsed", "updated_parsed"):
+            parsed = getattr(entry, attr, None)
+            if parsed:
+                try:
+                    return datetime(*parsed[:6], tzinfo=timezone.utc)
+                except (TypeError, ValueError):
+                    break
         value = str(
             getattr(entry, "published", "") or getattr(entry, "updated", "") or ""
         ).strip()
@@ -495,10 +604,10 @@ class BuiltinNewsTool:
             return None
         if len(text) == 10:
             try:
-                day = datetime.strptime(text, "%Y-%m-%d").date()
-                return datetime.combine(day, time.min, tzinfo=timezone.utc)
-            except Exception:
+                day = date.fromisoformat(text)
+            except ValueError:
                 return None
+            return datetime.combine(day, time.min, tzinfo=timezone.utc)
         return BuiltinNewsTool._parse_date(text)
 
     @staticmethod
@@ -508,10 +617,10 @@ class BuiltinNewsTool:
             return None
         if len(text) == 10:
             try:
-                day = datetime.strptime(text, "%Y-%m-%d").date()
-                return datetime.combine(day, time.max, tzinfo=timezone.utc)
-            except Exception:
+                day = date.fromisoformat(text)
+            except ValueError:
                 return None
+            return datetime.combine(day, time.max, tzinfo=timezone.utc)
         return BuiltinNewsTool._parse_date(text)
 
     @staticmethod
@@ -521,24 +630,11 @@ class BuiltinNewsTool:
         text = str(value).strip()
         if not text:
             return None
-        try:
-            parsed = parsedate_to_datetime(text)
-            if parsed.tzinfo is None:
-                return parsed.replace(tzinfo=timezone.utc)
-            return parsed.astimezone(timezone.utc)
-        except Exception:
-            pass
-        try:
-            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
-            if parsed.tzinfo is None:
-                return parsed.replace(tzinfo=timezone.utc)
-            return parsed.astimezone(timezone.utc)
-        except Exception:
-            return None
+        return _parse_date_text(text)
 
     @staticmethod
     def _empty_result(query: str, warnings: List[str]) -> Dict[str, Any]:
-        retrieved_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        retrieved_at = utc_now_iso()
         return {
             "query": query,
             "symbol": "",
@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 from market_reporter.config import AppConfig
 from market_reporter.core.registry import ProviderRegistry
 from market_reporter.core.types import Quote
+from market_reporter.core.utils import utc_now_iso
 from market_reporter.modules.dashboard.schemas import (
     DashboardIndexMetricView,
     DashboardIndicesSnapshotView,
@@ -224,7 +225,7 @@ class DashboardService:
 
     @staticmethod
     def _unavailable_quote(symbol: str, market: str) -> Quote:
-        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        now = utc_now_iso()
         currency = {
             "CN": "CNY",
             "HK": "HKD",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
 from typing import Dict, List
@@ -17,10 +18,21 @@ class FredFundFlowProvider:
         self.client = client
 
     async def collect(self, periods: int) -> Dict[str, List[FlowPoint]]:
+        # Series are independent CSV downloads; fetch them concurrently and
+        # parse in configuration order.  Let every download settle before
+        # surfacing the first failure so none is left running unobserved.
+        csv_texts = await asyncio.gather(
+            *[
+                self.client.get_text(FRED_CSV_URL, params={"id": series.series_id})
+                for series in FRED_SERIES
+            ],
+            return_exceptions=True,
+        )
+        for csv_text in csv_texts:
+            if isinstance(csv_text, BaseException):
+                raise csv_text
         output: Dict[str, List[FlowPoint]] = {}
-        for series in FRED_SERIES:
-            # Pull each configured series independently so one failure does not block others.
-            csv_text = await self.client.get_text(FRED_CSV_URL, params={"id": series.series_id})
+        for series, csv_text in zip(FRED_SERIES, csv_texts):
             reader = csv.DictReader(io.StringIO(csv_text))
             points: List[FlowPoint] = []
             for row in reader:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Dict, List, Tuple
 
 from market_reporter.config import AppConfig
@@ -29,16 +30,26 @@ class FundFlowService:
     async def collect(self, periods: int) -> Tuple[Dict[str, List[FlowPoint]], List[str]]:
         merged: Dict[str, List[FlowPoint]] = {}
         warnings: List[str] = []
-        # Collect configured providers sequentially and tolerate partial failures.
-        for provider_id in self.config.modules.fund_flow.providers:
-            try:
-                provider = self.registry.resolve(self.MODULE_NAME, provider_id)
-                result = await provider.collect(periods=periods)
-                for key, points in result.items():
-                    merged[key] = points
-            except Exception as exc:
-                warnings.append(f"Fund-flow provider failed [{provider_id}]: {exc}")
+        provider_ids = list(self.config.modules.fund_flow.providers)
+        # Providers hit unrelated upstreams, so collect them concurrently and
+        # merge in configured order while tolerating partial failures.
+        settled = await asyncio.gather(
+            *[self._collect_provider(provider_id, periods) for provider_id in provider_ids],
+            return_exceptions=True,
+        )
+        for provider_id, result in zip(provider_ids, settled):
+            if isinstance(result, Exception):
+                warnings.append(f"Fund-flow provider failed [{provider_id}]: {result}")
+                continue
+            for key, points in result.items():
+                merged[key] = points
         return merged, warnings
 
+    async def _collect_provider(
+        self, provider_id: str, periods: int
+    ) -> Dict[str, List[FlowPoint]]:
+        provider = self.registry.resolve(self.MODULE_NAME, provider_id)
+        return await provider.collect(periods=periods)
+
     def provider_ids(self) -> List[str]:
         return self.registry.list_ids(self.MODULE_NAME)
@@ -0,0 +1,95 @@
+"""Shared Longbridge ``QuoteContext`` handles.
+
+Building a ``QuoteContext`` authenticates and opens a connection, so every
+Longbridge caller in the application should obtain it through this module
+instead of constructing ``Config``/``QuoteContext`` per call.
+
+The module exposes:
+
+* ``get_quote_context(lb_config)`` – return the context for these
+  credentials, creating it on first use (call from a worker thread).
+* ``reset_quote_context(lb_config)`` – drop a context after a connection
+  error so the next caller reconnects.
+* ``is_context_error(exc)`` – whether *exc* may mean the context is dead.
+* ``LB_PERIOD_NAMES`` – interval -> ``longbridge.openapi.Period`` member name.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Tuple
+
+from market_reporter.config import LongbridgeConfig
+
+# Internal interval -> longbridge.openapi.Period member name.  Plain strings so
+# callers can validate intervals without importing the SDK or connecting.
+LB_PERIOD_NAMES: Dict[str, str] = {
+    "1m": "Min_1",
+    "5m": "Min_5",
+    "15m": "Min_15",
+    "30m": "Min_30",
+    "60m": "Min_60",
+    "1d": "Day",
+    "1w": "Week",
+    "1M": "Month",
+}
+
+# app_key -> ((app_key, app_secret, access_token), QuoteContext).  Keyed on the
+# app so a rotated secret or token replaces the app's context instead of
+# leaving the old one (and its connection) behind.
+_ContextKey = Tuple[str, str, str]
+_CONTEXTS: Dict[str, Tuple[_ContextKey, Any]] = {}
+_CONTEXT_LOCK = threading.Lock()
+
+
+def _context_key(lb_config: LongbridgeConfig) -> _ContextKey:
+    return (lb_config.app_key, lb_config.app_secret, lb_config.access_token)
+
+
+def get_quote_context(lb_config: LongbridgeConfig) -> Any:
+    """Return the shared ``QuoteContext`` for *lb_config*'s credentials.
+
+    Callers should ask for the context on each use rather than holding on to
+    it, so resets and credential rotations take effect.
+    """
+    key = _context_key(lb_config)
+    entry = _CONTEXTS.get(lb_config.app_key)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    with _CONTEXT_LOCK:
+        entry = _CONTEXTS.get(lb_config.app_key)
+        if entry is None or entry[0] != key:
+            from longbridge.openapi import Config, QuoteContext
+
+            config = Config(
+                app_key=lb_config.app_key,
+                app_secret=lb_config.app_secret,
+                access_token=lb_config.access_token,
+            )
+            entry = (key, QuoteContext(config))
+            _CONTEXTS[lb_config.app_key] = entry
+        return entry[1]
+
+
+def reset_quote_context(lb_config: LongbridgeConfig) -> None:
+    """Forget the shared context for *lb_config* so the next call reconnects."""
+    with _CONTEXT_LOCK:
+        entry = _CONTEXTS.get(lb_config.app_key)
+        # A context already replaced by rotated credentials stays in place.
+        if entry is not None and entry[0] == _context_key(lb_config):
+            del _CONTEXTS[lb_config.app_key]
+
+
+def is_context_error(exc: BaseException) -> bool:
+    """Whether *exc* may leave the shared context unusable.
+
+    Socket failures surface as ``OSError``; the SDK reports dropped or
+    expired sessions (and auth failures) as ``OpenApiException``.
+    """
+    if isinstance(exc, OSError):
+        return True
+    try:
+        from longbridge.openapi import OpenApiException
+    except ImportError:
+        return False
+    return isinstance(exc, OpenApiException)
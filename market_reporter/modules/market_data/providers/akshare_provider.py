@@ -1,12 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import os
-from datetime import datetime, timezone
-from typing import List
+from typing import Any, List, Optional
 
 from market_reporter.core.types import CurvePoint, KLineBar, Quote
+from market_reporter.core.utils import silence_console, utc_now_iso
 from market_reporter.modules.market_data.symbol_mapper import (
     normalize_symbol,
     strip_market_suffix,
@@ -16,6 +14,17 @@ from market_reporter.modules.market_data.symbol_mapper import (
 class AkshareMarketDataProvider:
     provider_id = "akshare"
 
+    def __init__(self) -> None:
+        self._ak: Optional[Any] = None
+
+    def _akshare(self) -> Any:
+        """Import akshare on first use and keep the module reference."""
+        if self._ak is None:
+            import akshare as ak
+
+            self._ak = ak
+        return self._ak
+
     async def get_quote(self, symbol: str, market: str) -> Quote:
         # akshare calls are sync and can be slow; isolate them in worker threads.
         return await asyncio.to_thread(self._get_quote_sync, symbol, market)
@@ -46,12 +55,12 @@ class AkshareMarketDataProvider:
         ]
 
     def _get_quote_sync(self, symbol: str, market: str) -> Quote:
-        import akshare as ak
+        ak = self._akshare()
 
         market = market.upper()
         normalized = normalize_symbol(symbol, market)
         code = strip_market_suffix(normalized)
-        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        now = utc_now_iso()
 
         if market == "CN":
             # CN/HK/US use different akshare spot endpoints.
@@ -113,63 +122,63 @@ class AkshareMarketDataProvider:
     def _get_kline_sync(
         self, symbol: str, market: str, interval: str, limit: int
     ) -> List[KLineBar]:
-        import akshare as ak
+        ak = self._akshare()
 
         market = market.upper()
         normalized = normalize_symbol(symbol, market)
         code = strip_market_suffix(normalized)
-        rows: List[KLineBar] = []
 
         if market == "CN" and interval in {"1m", "5m"}:
             period = "1" if interval == "1m" else "5"
             with self._silence_console():
                 df = ak.stock_zh_a_hist_min_em(symbol=code, period=period, adjust="")
-            for _, row in df.tail(limit).iterrows():
-                rows.append(
-                    KLineBar(
-                        symbol=normalized,
-                        market=market,
-                        interval=interval,
-                        ts=str(row["时间"]),
-                        open=float(row["开盘"]),
-                        high=float(row["最高"]),
-                        low=float(row["最低"]),
-                        close=float(row["收盘"]),
-                        volume=float(row.get("成交量", 0.0)),
-                        source=self.provider_id,
-                    )
-                )
-            return rows
+            return self._bars_from_frame(
+                df.tail(limit), "时间", normalized, market, interval
+            )
 
         if market == "CN" and interval in {"1d", "1w"}:
             period = "daily" if interval == "1d" else "weekly"
             with self._silence_console():
                 df = ak.stock_zh_a_hist(symbol=code, period=period, adjust="")
-            for _, row in df.tail(limit).iterrows():
-                rows.append(
-                    KLineBar(
-                        symbol=normalized,
-                        market=market,
-                        interval=interval,
-                        ts=str(row["日期"]),
-                        open=float(row["开盘"]),
-                        high=float(row["最高"]),
-                        low=float(row["最低"]),
-                        close=float(row["收盘"]),
-                        volume=float(row.get("成交量", 0.0)),
-                        source=self.provider_id,
-                    )
-                )
-            return rows
+            return self._bars_from_frame(
+                df.tail(limit), "日期", normalized, market, interval
+            )
 
         # Current provider implementation intentionally limits scope to CN bars.
         raise ValueError(
             f"Akshare kline unsupported for market={market}, interval={interval}"
         )
 
+    def _bars_from_frame(
+        self, frame, ts_column: str, symbol: str, market: str, interval: str
+    ) -> List[KLineBar]:
+        # Read each column once rather than building a Series per row.
+        volumes = (
+            frame["成交量"].tolist() if "成交量" in frame.columns else [0.0] * len(frame)
+        )
+        return [
+            KLineBar(
+                symbol=symbol,
+                market=market,
+                interval=interval,
+                ts=str(ts),
+                open=float(open_value),
+                high=float(high_value),
+                low=float(low_value),
+                close=float(close_value),
+                volume=float(volume),
+                source=self.provider_id,
+            )
+            for ts, open_value, high_value, low_value, close_value, volume in zip(
+                frame[ts_column].tolist(),
+                frame["开盘"].tolist(),
+                frame["最高"].tolist(),
+                frame["最低"].tolist(),
+                frame["收盘"].tolist(),
+                volumes,
+            )
+        ]
+
     @staticmethod
-    @contextlib.contextmanager
     def _silence_console():
-        with open(os.devnull, "w", encoding="utf-8") as sink:
-            with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
-                yield
+        return silence_console()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
 from market_reporter.core.types import CurvePoint, KLineBar, Quote
 from market_reporter.modules.market_data.symbol_mapper import (
@@ -15,6 +15,11 @@ logger = logging.getLogger(__name__)
 # Per-provider timeout in seconds.  If a single provider takes longer than
 # this, we skip it and try the next one in the failover chain.
 _PROVIDER_TIMEOUT = 8
+# Cap on concurrent one-by-one quote fallbacks.  Each can land on akshare,
+# which downloads a whole market spot frame per call.
+_FALLBACK_CONCURRENCY = 4
+
+T = TypeVar("T")
 
 
 class CompositeMarketDataProvider:
@@ -31,34 +36,15 @@ class CompositeMarketDataProvider:
 
     async def get_quote(self, symbol: str, market: str) -> Quote:
         # First successful provider wins; errors are intentionally swallowed for failover.
-        for provider in self._ordered(market=market, symbol=symbol):
-            try:
-                return await asyncio.wait_for(
-                    provider.get_quote(symbol=symbol, market=market),
-                    timeout=self._timeout,
-                )
-            except asyncio.TimeoutError:
-                pid = getattr(provider, "provider_id", type(provider).__name__)
-                logger.warning(
-                    "Provider %s timed out (%.1fs) for quote %s:%s",
-                    pid,
-                    self._timeout,
-                    market,
-                    symbol,
-                )
-                continue
-            except Exception as exc:
-                pid = getattr(provider, "provider_id", type(provider).__name__)
-                logger.warning(
-                    "Provider %s failed for quote %s:%s – %s: %s",
-                    pid,
-                    market,
-                    symbol,
-                    type(exc).__name__,
-                    exc,
-                )
-                continue
-        raise ValueError(f"No available quote provider for {market}:{symbol}")
+        quote = await self._first_success(
+            "quote",
+            symbol,
+            market,
+            lambda provider: provider.get_quote(symbol=symbol, market=market),
+        )
+        if quote is None:
+            raise ValueError(f"No available quote provider for {market}:{symbol}")
+        return quote
 
     async def get_quotes(self, items: List[tuple]) -> List[Quote]:
         """Batch quote fetch.  Groups items by preferred provider to minimise
@@ -127,87 +113,96 @@ class CompositeMarketDataProvider:
                 )
                 individual_items.extend(batch_items)
 
-        # Fall back to one-by-one for remaining items.
-        for symbol, market in individual_items:
-            try:
-                quote = await self.get_quote(symbol=symbol, market=market)
-                results.append(quote)
-            except Exception:
-                pass
+        # Fall back to one-by-one for remaining items; the lookups are
+        # independent, so issue them together under a small concurrency cap.
+        semaphore = asyncio.Semaphore(_FALLBACK_CONCURRENCY)
+
+        async def fetch_one(symbol: str, market: str) -> Quote:
+            async with semaphore:
+                return await self.get_quote(symbol=symbol, market=market)
+
+        settled = await asyncio.gather(
+            *(fetch_one(symbol, market) for symbol, market in individual_items),
+            return_exceptions=True,
+        )
+        results.extend(quote for quote in settled if isinstance(quote, Quote))
 
         return results
 
     async def get_kline(
         self, symbol: str, market: str, interval: str, limit: int
     ) -> List[KLineBar]:
-        for provider in self._ordered(market=market, symbol=symbol):
-            try:
-                rows = await asyncio.wait_for(
-                    provider.get_kline(
-                        symbol=symbol, market=market, interval=interval, limit=limit
-                    ),
-                    timeout=self._timeout,
-                )
-                if rows:
-                    return rows
-            except asyncio.TimeoutError:
-                pid = getattr(provider, "provider_id", type(provider).__name__)
-                logger.warning(
-                    "Provider %s timed out (%.1fs) for kline %s:%s",
-                    pid,
-                    self._timeout,
-                    market,
-                    symbol,
-                )
-                continue
-            except Exception as exc:
-                pid = getattr(provider, "provider_id", type(provider).__name__)
-                logger.warning(
-                    "Provider %s failed for kline %s:%s – %s: %s",
-                    pid,
-                    market,
-                    symbol,
-                    type(exc).__name__,
-                    exc,
-                )
-                continue
-        raise ValueError(
-            f"No available kline provider for {market}:{symbol}, interval={interval}"
+        rows = await self._first_success(
+            "kline",
+            symbol,
+            market,
+            lambda provider: provider.get_kline(
+                symbol=symbol, market=market, interval=interval, limit=limit
+            ),
         )
+        if not rows:
+            raise ValueError(
+                f"No available kline provider for {market}:{symbol}, interval={interval}"
+            )
+        return rows
 
     async def get_curve(
         self, symbol: str, market: str, window: str
     ) -> List[CurvePoint]:
+        rows = await self._first_success(
+            "curve",
+            symbol,
+            market,
+            lambda provider: provider.get_curve(
+                symbol=symbol, market=market, window=window
+            ),
+        )
+        if not rows:
+            raise ValueError(f"No available curve provider for {market}:{symbol}")
+        return rows
+
+    async def _first_success(
+        self,
+        kind: str,
+        symbol: str,
+        market: str,
+        call: Callable[[Any], Awaitable[T]],
+    ) -> Optional[T]:
+        """Walk the failover chain and return the first non-empty result.
+
+        Providers are tried one at a time in ``_ordered`` priority; each gets
+        ``provider_timeout`` seconds.  They are deliberately not raced: the
+        SDK calls run in worker threads that cannot be cancelled, so a
+        hedged loser would keep its upstream request going anyway.
+        """
         for provider in self._ordered(market=market, symbol=symbol):
+            pid = getattr(provider, "provider_id", type(provider).__name__)
             try:
-                rows = await asyncio.wait_for(
-                    provider.get_curve(symbol=symbol, market=market, window=window),
-                    timeout=self._timeout,
-                )
-                if rows:
-                    return rows
+                result = await asyncio.wait_for(call(provider), timeout=self._timeout)
             except asyncio.TimeoutError:
-                pid = getattr(provider, "provider_id", type(provider).__name__)
                 logger.warning(
-                    "Provider %s timed out (%.1fs) for curve %s:%s",
+                    "Provider %s timed out (%.1fs) for %s %s:%s",
                     pid,
                     self._timeout,
+                    kind,
                     market,
                     symbol,
                 )
                 continue
             except Exception as exc:
-                pid = getattr(provider, "provider_id", type(provider).__name__)
                 logger.warning(
-                    "Provider %s failed for curve %s:%s – %s: %s",
+                    "Provider %s failed for %s %s:%s – %s: %s",
                     pid,
+                    kind,
                     market,
                     symbol,
                     type(exc).__name__,
                     exc,
                 )
                 continue
-        raise ValueError(f"No available curve provider for {market}:{symbol}")
+            if result:
+                return result
+        return None
 
     def _ordered(self, market: str, symbol: str = ""):
         market = market.upper()
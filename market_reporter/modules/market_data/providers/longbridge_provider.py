@@ -8,11 +8,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Tuple, cast
 
 from market_reporter.config import LongbridgeConfig
 from market_reporter.core.types import CurvePoint, KLineBar, Quote
+from market_reporter.core.utils import utc_now_iso
+from market_reporter.modules.market_data.lb_context import (
+    LB_PERIOD_NAMES as _PERIOD_NAMES,
+    get_quote_context,
+    is_context_error,
+    reset_quote_context,
+)
 from market_reporter.modules.market_data.symbol_mapper import (
     normalize_symbol,
     to_longbridge_symbol,
@@ -26,25 +32,23 @@ class LongbridgeMarketDataProvider:
 
     def __init__(self, lb_config: LongbridgeConfig) -> None:
         self._lb_config = lb_config
-        self._ctx: Optional[Any] = None
 
     # ------------------------------------------------------------------
-    # Lazy context – created once per provider instance.
+    # Lazy context – shared across providers with the same credentials.
     # ------------------------------------------------------------------
 
     def _ensure_ctx(self) -> Any:
-        """Create a QuoteContext on first use (must be called in a thread)."""
-        if self._ctx is not None:
-            return self._ctx
-        from longbridge.openapi import Config, QuoteContext
-
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        self._ctx = QuoteContext(config)
-        return self._ctx
+        """Return the shared QuoteContext (must be called in a thread).
+
+        Not cached on the instance, so a reset or credential rotation in
+        ``lb_context`` is picked up on the next call.
+        """
+        return get_quote_context(self._lb_config)
+
+    def _reset_ctx_on(self, exc: BaseException) -> None:
+        """Drop the shared context if *exc* suggests its connection is gone."""
+        if is_context_error(exc):
+            reset_quote_context(self._lb_config)
 
     # ------------------------------------------------------------------
     # Public async interface (MarketDataProvider protocol)
@@ -59,6 +63,8 @@ class LongbridgeMarketDataProvider:
     async def get_kline(
         self, symbol: str, market: str, interval: str, limit: int
     ) -> List[KLineBar]:
+        if interval not in _PERIOD_NAMES:
+            raise ValueError(f"Unsupported interval for Longbridge: {interval}")
         return await asyncio.to_thread(
             self._get_kline_sync, symbol, market, interval, limit
         )
@@ -92,7 +98,11 @@ class LongbridgeMarketDataProvider:
             prepared.append((normalized, market_upper, lb_symbol))
 
         lb_symbols = [entry[2] for entry in prepared]
-        quote_rows = ctx.quote(lb_symbols)
+        try:
+            quote_rows = ctx.quote(lb_symbols)
+        except Exception as exc:
+            self._reset_ctx_on(exc)
+            raise
         ordered_rows = list(quote_rows)
         row_map: Dict[str, object] = {
             str(getattr(row, "symbol", "") or "").strip().upper(): row
@@ -100,6 +110,8 @@ class LongbridgeMarketDataProvider:
             if str(getattr(row, "symbol", "") or "").strip()
         }
 
+        # Rows without an exchange timestamp share one fallback per batch.
+        fallback_ts = utc_now_iso()
         quotes: List[Quote] = []
         for idx, (normalized, market_upper, lb_symbol) in enumerate(prepared):
             row = row_map.get(lb_symbol.upper())
@@ -112,6 +124,7 @@ class LongbridgeMarketDataProvider:
                     row=row,
                     normalized_symbol=normalized,
                     market=market_upper,
+                    fallback_ts=fallback_ts,
                 )
             )
         return quotes
@@ -119,27 +132,33 @@ class LongbridgeMarketDataProvider:
     def _get_kline_sync(
         self, symbol: str, market: str, interval: str, limit: int
     ) -> List[KLineBar]:
-        from longbridge.openapi import AdjustType, Period
-
-        ctx = cast(Any, self._ensure_ctx())
-        lb_symbol = to_longbridge_symbol(symbol, market)
-        normalized = normalize_symbol(symbol, market)
+        from longbridge.openapi import AdjustType
 
         period = self._map_period(interval)
         if period is None:
             raise ValueError(f"Unsupported interval for Longbridge: {interval}")
 
-        candlesticks = ctx.candlesticks(
-            lb_symbol, period, limit, AdjustType.ForwardAdjust
-        )
+        ctx = cast(Any, self._ensure_ctx())
+        lb_symbol = to_longbridge_symbol(symbol, market)
+        normalized = normalize_symbol(symbol, market)
+
+        try:
+            candlesticks = ctx.candlesticks(
+                lb_symbol, period, limit, AdjustType.ForwardAdjust
+            )
+        except Exception as exc:
+            self._reset_ctx_on(exc)
+            raise
 
+        market_upper = market.upper()
         bars: List[KLineBar] = []
         for c in candlesticks:
             ts = c.timestamp.isoformat(timespec="seconds") if c.timestamp else ""
+            # Fields are coerced explicitly below, so skip pydantic validation.
             bars.append(
-                KLineBar(
+                KLineBar.model_construct(
                     symbol=normalized,
-                    market=market.upper(),
+                    market=market_upper,
                     interval=interval,
                     ts=ts,
                     open=float(c.open),
@@ -159,7 +178,11 @@ class LongbridgeMarketDataProvider:
         lb_symbol = to_longbridge_symbol(symbol, market)
         normalized = normalize_symbol(symbol, market)
 
-        intraday = ctx.intraday(lb_symbol)
+        try:
+            intraday = ctx.intraday(lb_symbol)
+        except Exception as exc:
+            self._reset_ctx_on(exc)
+            raise
 
         points: List[CurvePoint] = []
         for line in intraday:
@@ -183,19 +206,12 @@ class LongbridgeMarketDataProvider:
     @staticmethod
     def _map_period(interval: str):
         """Map internal interval string to Longbridge Period enum."""
+        name = _PERIOD_NAMES.get(interval)
+        if name is None:
+            return None
         from longbridge.openapi import Period
 
-        mapping = {
-            "1m": Period.Min_1,
-            "5m": Period.Min_5,
-            "15m": Period.Min_15,
-            "30m": Period.Min_30,
-            "60m": Period.Min_60,
-            "1d": Period.Day,
-            "1w": Period.Week,
-            "1M": Period.Month,
-        }
-        return mapping.get(interval)
+        return getattr(Period, name)
 
     @staticmethod
     def _currency_by_market(market: str) -> str:
@@ -205,7 +221,13 @@ class LongbridgeMarketDataProvider:
             "US": "USD",
         }.get(market.upper(), "")
 
-    def _build_quote(self, row: object, normalized_symbol: str, market: str) -> Quote:
+    def _build_quote(
+        self,
+        row: object,
+        normalized_symbol: str,
+        market: str,
+        fallback_ts: str,
+    ) -> Quote:
         price = float(getattr(row, "last_done", 0.0) or 0.0)
         prev_close_raw = getattr(row, "prev_close", None)
         prev_close = float(prev_close_raw) if prev_close_raw else None
@@ -216,11 +238,7 @@ class LongbridgeMarketDataProvider:
             pct = change / prev_close * 100
 
         ts_raw = getattr(row, "timestamp", None)
-        ts = (
-            ts_raw.isoformat(timespec="seconds")
-            if ts_raw
-            else datetime.now(timezone.utc).isoformat(timespec="seconds")
-        )
+        ts = ts_raw.isoformat(timespec="seconds") if ts_raw else fallback_ts
 
         volume_raw = getattr(row, "volume", None)
         volume = float(volume_raw) if volume_raw is not None else None
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, List, Optional, Tuple
 
 from market_reporter.core.types import CurvePoint, KLineBar, Quote
+from market_reporter.core.utils import utc_now_iso
 from market_reporter.modules.market_data.symbol_mapper import (
     normalize_symbol,
     to_yfinance_symbol,
@@ -30,6 +32,27 @@ def _as_float(value: Any) -> Optional[float]:
         return None
 
 
+_OHLCV_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+
+def _ohlcv_rows(frame: Any) -> List[Tuple[bool, List[float]]]:
+    """Return ``(prices_valid, [open, high, low, close, volume])`` per row.
+
+    The OHLCV columns are coerced into one float64 block so validity is a
+    single vectorised ``isfinite`` pass instead of one per column.
+    """
+    import numpy as np
+    import pandas as pd
+
+    block = (
+        frame.reindex(columns=list(_OHLCV_COLUMNS))
+        .apply(pd.to_numeric, errors="coerce")
+        .to_numpy(dtype=np.float64)
+    )
+    valid = np.isfinite(block[:, :4]).all(axis=1)
+    return list(zip(valid.tolist(), block.tolist()))
+
+
 def _to_iso_seconds(raw: Any) -> str:
     if hasattr(raw, "to_pydatetime"):
         return raw.to_pydatetime().isoformat(timespec="seconds")
@@ -38,6 +61,13 @@ def _to_iso_seconds(raw: Any) -> str:
     return str(raw)
 
 
+def _iso_index(index: Any) -> List[str]:
+    """Format a whole DatetimeIndex at once rather than boxing each label."""
+    if hasattr(index, "to_pydatetime"):
+        return [item.isoformat(timespec="seconds") for item in index.to_pydatetime()]
+    return [_to_iso_seconds(item) for item in index]
+
+
 class YahooFinanceMarketDataProvider:
     provider_id = "yfinance"
 
@@ -98,17 +128,19 @@ class YahooFinanceMarketDataProvider:
 
         quotes: List[Quote] = []
         multi_ticker = len(yf_symbols) > 1
+        # Resolve the ticker level of the column index once, not per symbol.
+        tickers_present = (
+            set(data.columns.get_level_values(0)) if multi_ticker else set()
+        )
 
         for yf_sym, (orig_symbol, orig_market) in yf_to_orig.items():
             try:
-                if multi_ticker:
-                    if yf_sym not in data.columns.get_level_values(0):
-                        continue
-                    closes = data[yf_sym]["Close"].dropna()
-                    volumes_series = data[yf_sym].get("Volume")
-                else:
-                    closes = data["Close"].dropna()
-                    volumes_series = data.get("Volume")
+                if multi_ticker and yf_sym not in tickers_present:
+                    continue
+                # Slice the ticker's sub-frame once and read both columns from it.
+                frame = data[yf_sym] if multi_ticker else data
+                closes = frame["Close"].dropna()
+                volumes_series = frame.get("Volume")
 
                 if closes.empty:
                     continue
@@ -241,22 +273,23 @@ class YahooFinanceMarketDataProvider:
     ) -> Quote:
         ticker = yf.Ticker(yf_symbol)
         info = ticker.fast_info
-        has_price = (
-            info.get("last_price") is not None
-            or info.get("regular_market_price") is not None
-        )
-        if not has_price:
+        # fast_info resolves keys lazily (some with their own HTTP call), so
+        # read each one once and reuse it below.
+        last_price = info.get("last_price")
+        market_price = info.get("regular_market_price")
+        currency = str(info.get("currency") or "")
+        if last_price is None and market_price is None:
             quote_from_history = self._quote_from_history(
                 ticker=ticker,
                 symbol=symbol,
                 market=market,
-                currency=str(info.get("currency") or ""),
+                currency=currency,
             )
             if quote_from_history is not None:
                 return quote_from_history
             raise ValueError(f"No quote data for symbol: {yf_symbol}")
-        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
-        price = _as_float(info.get("last_price") or info.get("regular_market_price"))
+        now = utc_now_iso()
+        price = _as_float(last_price or market_price)
         if price is None:
             raise ValueError(f"No quote data for symbol: {yf_symbol}")
         prev = _as_float(
@@ -277,7 +310,7 @@ class YahooFinanceMarketDataProvider:
             change=change,
             change_percent=pct,
             volume=volume,
-            currency=str(info.get("currency") or ""),
+            currency=currency,
             source=self.provider_id,
         )
 
@@ -346,35 +379,32 @@ class YahooFinanceMarketDataProvider:
             if hist is None or hist.empty:
                 continue
 
+            # Coerce the OHLCV block once instead of materialising a Series
+            # per row through iterrows().
+            frame = hist.tail(limit)
+            market_upper = market.upper()
             rows: List[KLineBar] = []
-            for idx, row in hist.tail(limit).iterrows():
-                open_value = _as_float(row.get("Open") if hasattr(row, "get") else None)
-                high_value = _as_float(row.get("High") if hasattr(row, "get") else None)
-                low_value = _as_float(row.get("Low") if hasattr(row, "get") else None)
-                close_value = _as_float(
-                    row.get("Close") if hasattr(row, "get") else None
-                )
-                if (
-                    open_value is None
-                    or high_value is None
-                    or low_value is None
-                    or close_value is None
-                ):
+            for ts, (prices_valid, values) in zip(
+                _iso_index(frame.index), _ohlcv_rows(frame)
+            ):
+                if not prices_valid:
                     continue
-                ts = _to_iso_seconds(idx)
+                open_value, high_value, low_value, close_value, volume = values
+                if not math.isfinite(volume):
+                    volume = None
+                # Values are already float/None from the coerced block, so skip
+                # per-bar pydantic validation.
                 rows.append(
-                    KLineBar(
+                    KLineBar.model_construct(
                         symbol=normalized,
-                        market=market.upper(),
+                        market=market_upper,
                         interval=interval,
                         ts=ts,
                         open=open_value,
                         high=high_value,
                         low=low_value,
                         close=close_value,
-                        volume=_as_float(
-                            row.get("Volume") if hasattr(row, "get") else None
-                        ),
+                        volume=volume,
                         source=self.provider_id,
                     )
                 )
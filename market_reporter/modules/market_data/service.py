@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
 from typing import List, Optional
 
 from market_reporter.config import AppConfig
 from market_reporter.core.registry import ProviderRegistry
 from market_reporter.core.types import CurvePoint, KLineBar, Quote
+from market_reporter.core.utils import utc_now_iso
 from market_reporter.infra.db.repos import MarketDataRepo
 from market_reporter.infra.db.session import session_scope
 from market_reporter.modules.market_data.symbol_mapper import normalize_symbol
 
+_QUOTE_MARKETS = frozenset({"CN", "HK", "US"})
+
 
 class MarketDataService:
     MODULE_NAME = "market_data"
@@ -68,12 +70,14 @@ class MarketDataService:
         if not items:
             return []
 
-        normalized_items: List[tuple[str, str]] = [
-            (normalize_symbol(symbol, market), market.upper())
-            for symbol, market in items
-            if str(symbol or "").strip()
-            and str(market or "").strip().upper() in {"CN", "HK", "US"}
-        ]
+        # Validate and normalize in the same pass; the market code is
+        # resolved once per item and reused for the symbol mapping.
+        normalized_items: List[tuple[str, str]] = []
+        for symbol, market in items:
+            market_code = str(market or "").strip().upper()
+            if market_code not in _QUOTE_MARKETS or not str(symbol or "").strip():
+                continue
+            normalized_items.append((normalize_symbol(symbol, market_code), market_code))
         if not normalized_items:
             return []
 
@@ -147,7 +151,7 @@ class MarketDataService:
             if cached is not None:
                 return cached
             # Last-resort placeholder keeps API response schema stable.
-            now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            now = utc_now_iso()
             return Quote(
                 symbol=normalized_symbol,
                 market=resolved_market,
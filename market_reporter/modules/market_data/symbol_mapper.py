@@ -1,6 +1,16 @@
 from __future__ import annotations
 
+from functools import lru_cache
 
+# Exchange suffix -> market, for symbols that carry their listing venue.
+_SUFFIX_MARKETS = {"HK": "HK", "SH": "CN", "SZ": "CN", "BJ": "CN"}
+
+# Watchlists and agent tools convert the same few symbols on every request;
+# the mappings below are pure, so results are memoised per (symbol, market).
+_SYMBOL_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def normalize_symbol(symbol: str, market: str) -> str:
     raw = symbol.strip().upper()
     market = market.strip().upper()
@@ -47,6 +57,7 @@ def to_yfinance_symbol(symbol: str, market: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def to_longbridge_symbol(symbol: str, market: str) -> str:
     """Convert internal symbol format to Longbridge format.
 
@@ -92,6 +103,15 @@ def to_longbridge_symbol(symbol: str, market: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=4096)
+def infer_market_from_symbol(symbol: str, fallback: str = "US") -> str:
+    """Return the market named by *symbol*'s suffix, else *fallback*."""
+    _, dot, suffix = (symbol or "").strip().upper().rpartition(".")
+    if dot and suffix in _SUFFIX_MARKETS:
+        return _SUFFIX_MARKETS[suffix]
+    return fallback.upper() if fallback else "US"
+
+
 def strip_market_suffix(symbol: str) -> str:
     raw = symbol.strip().upper()
     for suffix in (".SH", ".SZ", ".BJ", ".HK", ".SS"):
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Protocol, Sequence, Tuple
+from typing import Any, Dict, List, Literal, Optional, Protocol, Sequence, Set, Tuple
 
 from market_reporter.config import AnalysisProviderConfig, AppConfig
+from market_reporter.core.types import AnalysisOutput
 from market_reporter.infra.db.session import init_db
-from market_reporter.modules.analysis.agent.schemas import AgentRunRequest
+from market_reporter.modules.analysis.agent.schemas import (
+    AgentRunRequest,
+    AgentRunResult,
+)
 from market_reporter.modules.analysis.agent.service import AgentService
 from market_reporter.modules.analysis.agent.skill_catalog import SkillCatalog
 from market_reporter.modules.watchlist.schemas import WatchlistItem
@@ -13,7 +18,7 @@ from market_reporter.modules.watchlist.service import WatchlistService
 from market_reporter.schemas import RunRequest
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportSkillContext:
     config: AppConfig
     overrides: Optional[RunRequest]
@@ -26,7 +31,7 @@ class ReportSkillContext:
     on_step: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportSkillResult:
     markdown: str
     analysis_payload: Dict[str, object]
@@ -109,6 +114,11 @@ class WatchlistReportSkill:
 
         rows: List[Dict[str, Any]] = []
         news_total = 0
+        # Aggregates are folded into the same pass that collects the rows.
+        successful_items = 0
+        confidence_sum = 0.0
+        confidence_count = 0
+        sentiment_score = 0
         for item in selected_items:
             row = await self._run_watchlist_item(
                 item=item,
@@ -122,25 +132,21 @@ class WatchlistReportSkill:
             )
             rows.append(row)
             news_total += int(row.get("news_total") or 0)
-            row_warnings = row.get("warnings")
-            if isinstance(row_warnings, list):
-                warnings.extend([str(item) for item in row_warnings])
-
-        successful = [row for row in rows if str(row.get("status")) == "SUCCEEDED"]
-        confidence_values = [
-            float(row.get("confidence") or 0.0)
-            for row in successful
-            if row.get("confidence") is not None
-        ]
+            # Rows come from _run_watchlist_item, whose warnings are already
+            # a list of strings; no per-item coercion needed.
+            warnings.extend(row.get("warnings") or ())
+            if str(row.get("status")) != "SUCCEEDED":
+                continue
+            successful_items += 1
+            confidence = row.get("confidence")
+            if confidence is not None:
+                confidence_sum += float(confidence or 0.0)
+                confidence_count += 1
+            sentiment_score += _sentiment_score(str(row.get("sentiment") or ""))
+
         avg_confidence = (
-            sum(confidence_values) / len(confidence_values)
-            if confidence_values
-            else 0.0
+            confidence_sum / confidence_count if confidence_count else 0.0
         )
-
-        sentiment_score = 0
-        for row in successful:
-            sentiment_score += _sentiment_score(str(row.get("sentiment") or ""))
         if sentiment_score > 0:
             aggregate_sentiment = "bullish"
         elif sentiment_score < 0:
@@ -166,7 +172,7 @@ class WatchlistReportSkill:
                 "watchlist": {
                     "total_items": len(items),
                     "analyzed_items": len(selected_items),
-                    "successful_items": len(successful),
+                    "successful_items": successful_items,
                     "entries": rows,
                 }
             },
@@ -228,21 +234,7 @@ class WatchlistReportSkill:
                 "action_items": output.action_items,
                 "news_total": news_total,
                 "warnings": warnings,
-                "agent": {
-                    "final_report": run.final_report.model_dump(mode="json"),
-                    "tool_calls": [
-                        call.model_dump(mode="json") for call in run.tool_calls
-                    ],
-                    "evidence_map": [
-                        evidence.model_dump(mode="json")
-                        for evidence in run.evidence_map
-                    ],
-                    "guardrail_issues": [
-                        issue.model_dump(mode="json") for issue in run.guardrail_issues
-                    ],
-                    "analysis_input": run.analysis_input,
-                    "runtime_draft": run.runtime_draft.model_dump(mode="json"),
-                },
+                "agent": await asyncio.to_thread(_agent_run_payload, run),
             }
         except Exception as exc:
             return {
@@ -445,9 +437,24 @@ async def _run_single_agent_report(
         request=agent_request,
         run_result=agent_run,
     )
-    analysis_payload = analysis_output.model_dump(mode="json")
+    # JSON-mode dumps of a full run (tool traces, bars) are CPU-bound; keep
+    # them off the event loop so concurrent runs keep making progress.
+    analysis_payload = await asyncio.to_thread(
+        _report_payload, analysis_output, agent_run
+    )
     news_total, warnings = extract_agent_run_stats(agent_run)
-    analysis_payload["agent"] = {
+    return ReportSkillResult(
+        markdown=analysis_output.markdown,
+        analysis_payload=analysis_payload,
+        news_total=news_total,
+        warnings=warnings,
+        mode=agent_mode,
+        skill_id=skill_id,
+    )
+
+
+def _agent_run_payload(agent_run: AgentRunResult) -> Dict[str, Any]:
+    return {
         "final_report": agent_run.final_report.model_dump(mode="json"),
         "tool_calls": [item.model_dump(mode="json") for item in agent_run.tool_calls],
         "evidence_map": [
@@ -459,14 +466,14 @@ async def _run_single_agent_report(
         "analysis_input": agent_run.analysis_input,
         "runtime_draft": agent_run.runtime_draft.model_dump(mode="json"),
     }
-    return ReportSkillResult(
-        markdown=analysis_output.markdown,
-        analysis_payload=analysis_payload,
-        news_total=news_total,
-        warnings=warnings,
-        mode=agent_mode,
-        skill_id=skill_id,
-    )
+
+
+def _report_payload(
+    analysis_output: AnalysisOutput, agent_run: AgentRunResult
+) -> Dict[str, Any]:
+    payload = analysis_output.model_dump(mode="json")
+    payload["agent"] = _agent_run_payload(agent_run)
+    return payload
 
 
 def extract_agent_run_stats(agent_run: Any) -> Tuple[int, List[str]]:
@@ -487,6 +494,9 @@ def extract_agent_run_stats(agent_run: Any) -> Tuple[int, List[str]]:
             items = news_payload.get("items")
             if isinstance(items, list):
                 news_total = len(items)
+        # Several tools report the same provider fallback; keep the first
+        # occurrence of each warning in a single pass.
+        seen: Set[str] = set()
         for payload in tool_results.values():
             if not isinstance(payload, dict):
                 continue
@@ -494,7 +504,10 @@ def extract_agent_run_stats(agent_run: Any) -> Tuple[int, List[str]]:
             if not isinstance(row_warnings, list):
                 continue
             for row in row_warnings:
-                warnings.append(str(row))
+                text = str(row).strip()
+                if text and text not in seen:
+                    seen.add(text)
+                    warnings.append(text)
 
     guardrail_issues = (
         agent_run.guardrail_issues if hasattr(agent_run, "guardrail_issues") else []
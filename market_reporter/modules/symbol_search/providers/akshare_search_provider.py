@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import os
 import re
-from typing import List
+from typing import Any, Dict, List, Tuple
 
+from market_reporter.core.utils import silence_console
 from market_reporter.modules.market_data.symbol_mapper import normalize_symbol
 from market_reporter.modules.symbol_search.schemas import StockSearchResult
 
+# Market scope -> (akshare spot fetcher, exchange label, code zero-pad width).
+_SPOT_SOURCES: Dict[str, Tuple[str, str, int]] = {
+    "CN": ("stock_zh_a_spot_em", "CN", 0),
+    "HK": ("stock_hk_spot_em", "HKEX", 4),
+    "US": ("stock_us_spot_em", "US", 0),
+}
+
 
 class AkshareSearchProvider:
     provider_id = "akshare"
@@ -31,89 +37,61 @@ class AkshareSearchProvider:
         for scope in self._scopes(target_market=target_market, query_upper=q):
             if len(results) >= limit:
                 break
-
-            if scope == "CN":
-                try:
-                    with self._silence_console():
-                        df = ak.stock_zh_a_spot_em()
-                    code_col = df["代码"].astype(str)
-                    name_col = df["名称"].astype(str)
-                    matched = df[
-                        (code_col.str.upper().str.contains(q))
-                        | (name_col.str.upper().str.contains(q))
-                    ]
-                    for _, row in matched.head(limit).iterrows():
-                        symbol = normalize_symbol(str(row["代码"]), "CN")
-                        results.append(
-                            StockSearchResult(
-                                symbol=symbol,
-                                market="CN",
-                                name=str(row["名称"]),
-                                exchange="CN",
-                                source=self.provider_id,
-                                score=self._score(q, symbol, str(row["名称"])),
-                            )
-                        )
-                        if len(results) >= limit:
-                            break
-                except Exception:
-                    # Keep partial results from other markets/providers.
-                    pass
-            elif scope == "HK":
-                try:
-                    with self._silence_console():
-                        df = ak.stock_hk_spot_em()
-                    code_col = df["代码"].astype(str).str.zfill(4)
-                    name_col = df["名称"].astype(str)
-                    matched = df[
-                        (code_col.str.upper().str.contains(q))
-                        | (name_col.str.upper().str.contains(q))
-                    ]
-                    for _, row in matched.head(limit).iterrows():
-                        symbol = normalize_symbol(str(row["代码"]).zfill(4), "HK")
-                        results.append(
-                            StockSearchResult(
-                                symbol=symbol,
-                                market="HK",
-                                name=str(row["名称"]),
-                                exchange="HKEX",
-                                source=self.provider_id,
-                                score=self._score(q, symbol, str(row["名称"])),
-                            )
-                        )
-                        if len(results) >= limit:
-                            break
-                except Exception:
-                    pass
-            elif scope == "US":
-                try:
-                    with self._silence_console():
-                        df = ak.stock_us_spot_em()
-                    code_col = df["代码"].astype(str)
-                    name_col = df["名称"].astype(str)
-                    matched = df[
-                        (code_col.str.upper().str.contains(q))
-                        | (name_col.str.upper().str.contains(q))
-                    ]
-                    for _, row in matched.head(limit).iterrows():
-                        symbol = normalize_symbol(str(row["代码"]), "US")
-                        results.append(
-                            StockSearchResult(
-                                symbol=symbol,
-                                market="US",
-                                name=str(row["名称"]),
-                                exchange="US",
-                                source=self.provider_id,
-                                score=self._score(q, symbol, str(row["名称"])),
-                            )
-                        )
-                        if len(results) >= limit:
-                            break
-                except Exception:
-                    pass
+            fetcher, exchange, code_width = _SPOT_SOURCES[scope]
+            try:
+                with self._silence_console():
+                    df = getattr(ak, fetcher)()
+                results.extend(
+                    self._match_frame(
+                        df,
+                        query_upper=q,
+                        market=scope,
+                        exchange=exchange,
+                        code_width=code_width,
+                        limit=limit - len(results),
+                    )
+                )
+            except Exception:
+                # Keep partial results from other markets/providers.
+                pass
 
         return results[:limit]
 
+    def _match_frame(
+        self,
+        df: Any,
+        query_upper: str,
+        market: str,
+        exchange: str,
+        code_width: int,
+        limit: int,
+    ) -> List[StockSearchResult]:
+        # Pull the code/name columns out once and walk them as plain lists
+        # instead of boxing every matched row into a Series via iterrows().
+        codes = df["代码"].astype(str)
+        if code_width:
+            codes = codes.str.zfill(code_width)
+        names = df["名称"].astype(str)
+        mask = codes.str.upper().str.contains(
+            query_upper, regex=False
+        ) | names.str.upper().str.contains(query_upper, regex=False)
+        rows: List[StockSearchResult] = []
+        for code, name in zip(
+            codes[mask].head(limit).tolist(), names[mask].head(limit).tolist()
+        ):
+            symbol = normalize_symbol(code, market)
+            rows.append(
+                StockSearchResult(
+                    symbol=symbol,
+                    market=market,
+                    name=name,
+                    exchange=exchange,
+                    source=self.provider_id,
+                    score=self._score(query_upper, symbol, name),
+                )
+            )
+        return rows
+
     @staticmethod
     def _scopes(target_market: str, query_upper: str) -> List[str]:
         if target_market in {"CN", "HK", "US"}:
@@ -143,8 +121,5 @@ class AkshareSearchProvider:
         return 0.6
 
     @staticmethod
-    @contextlib.contextmanager
     def _silence_console():
-        with open(os.devnull, "w", encoding="utf-8") as sink:
-            with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
-                yield
+        return silence_console()
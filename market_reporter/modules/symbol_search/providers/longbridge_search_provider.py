@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Set, Tuple
 
 from market_reporter.config import LongbridgeConfig
+from market_reporter.modules.market_data.lb_context import (
+    get_quote_context,
+    is_context_error,
+    reset_quote_context,
+)
 from market_reporter.modules.market_data.symbol_mapper import (
     normalize_symbol,
     to_longbridge_symbol,
@@ -17,7 +22,6 @@ class LongbridgeSearchProvider:
 
     def __init__(self, lb_config: LongbridgeConfig) -> None:
         self._lb_config = lb_config
-        self._ctx: Optional[object] = None
 
     async def search(
         self, query: str, market: str, limit: int
@@ -94,7 +98,8 @@ class LongbridgeSearchProvider:
     def _fetch_quote_symbols(self, ctx, lb_symbols: List[str]) -> Set[str]:
         try:
             rows = ctx.quote(lb_symbols) or []
-        except Exception:
+        except Exception as exc:
+            self._reset_ctx_on(exc)
             return set()
         symbols: Set[str] = set()
         for row in rows:
@@ -106,7 +111,8 @@ class LongbridgeSearchProvider:
     def _fetch_static_names(self, ctx, lb_symbols: List[str]) -> Dict[str, str]:
         try:
             rows = ctx.static_info(lb_symbols) or []
-        except Exception:
+        except Exception as exc:
+            self._reset_ctx_on(exc)
             return {}
         names: Dict[str, str] = {}
         for row in rows:
@@ -117,20 +123,17 @@ class LongbridgeSearchProvider:
         return names
 
     def _ensure_ctx(self):
-        if self._ctx is not None:
-            return self._ctx
+        # Resolved per call so lb_context resets and rotations take effect.
         try:
-            from longbridge.openapi import Config, QuoteContext
-        except Exception as exc:
+            return get_quote_context(self._lb_config)
+        except ImportError as exc:
             raise RuntimeError("Longbridge SDK is unavailable") from exc
 
-        config = Config(
-            app_key=self._lb_config.app_key,
-            app_secret=self._lb_config.app_secret,
-            access_token=self._lb_config.access_token,
-        )
-        self._ctx = QuoteContext(config)
-        return self._ctx
+    def _reset_ctx_on(self, exc: BaseException) -> None:
+        # The lookups above degrade to empty results, so drop a dead context
+        # here or every later search would keep failing on it.
+        if is_context_error(exc):
+            reset_quote_context(self._lb_config)
 
     @staticmethod
     def _candidate_markets(query_upper: str, market: str) -> List[str]:
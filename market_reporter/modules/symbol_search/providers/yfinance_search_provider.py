@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 import httpx
 
 from market_reporter.modules.market_data.symbol_mapper import normalize_symbol
 from market_reporter.modules.symbol_search.schemas import StockSearchResult
 
+# Yahoo search rows name the same field differently by endpoint; the first
+# non-empty key wins.
+_MARKET_EXCHANGE_KEYS = ("exchange", "exchDisp")
+_NAME_KEYS = ("shortname", "longname")
+_EXCHANGE_KEYS = ("exchange", "fullExchangeName")
+
+
+def _first_truthy(row: Dict[str, Any], keys: Tuple[str, ...], default: Any = "") -> Any:
+    for key in keys:
+        value = row.get(key)
+        if value:
+            return value
+    return default
+
 
 class YahooFinanceSearchProvider:
     provider_id = "yfinance"
@@ -72,13 +86,16 @@ class YahooFinanceSearchProvider:
             if not symbol_raw:
                 continue
             # Infer market from symbol/exchange fields before normalization.
-            inferred_market = self._infer_market(symbol=symbol_raw, exchange=str(item.get("exchange") or item.get("exchDisp") or ""))
+            inferred_market = self._infer_market(
+                symbol=symbol_raw,
+                exchange=str(_first_truthy(item, _MARKET_EXCHANGE_KEYS)),
+            )
             if target_market != "ALL" and inferred_market != target_market:
                 continue
 
             normalized = self._normalize_for_market(symbol_raw, inferred_market)
-            name = str(item.get("shortname") or item.get("longname") or normalized)
-            exchange = str(item.get("exchange") or item.get("fullExchangeName") or "")
+            name = str(_first_truthy(item, _NAME_KEYS, normalized))
+            exchange = str(_first_truthy(item, _EXCHANGE_KEYS))
             score = self._score(query=query, symbol=normalized, name=name)
 
             results.append(
@@ -0,0 +1,511 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from market_reporter.config import LongbridgeConfig
+from market_reporter.modules.analysis.agent.tools import builtin_metrics_tool
+from market_reporter.modules.analysis.agent.tools.builtin_metrics_tool import (
+    BuiltinMetricsTool,
+)
+from market_reporter.modules.market_data import lb_context
+
+
+def _make_tool(app_key: str = "key") -> BuiltinMetricsTool:
+    return BuiltinMetricsTool(
+        lb_config=LongbridgeConfig(
+            enabled=True,
+            app_key=app_key,
+            app_secret="secret",
+            access_token="token",
+        )
+    )
+
+
+def _calc_payload(symbol: str, market: str, warnings=None):
+    return {
+        "action": "calc_indexes",
+        "symbol": symbol,
+        "market": market,
+        "metrics": {"trailing_pe": 20.0},
+        "as_of": "2026-02-20T00:00:00+00:00",
+        "source": "longbridge",
+        "retrieved_at": "2026-02-20T00:00:00+00:00",
+        "warnings": list(warnings or []),
+    }
+
+
+class BuiltinMetricsToolSnapshotCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        builtin_metrics_tool._SNAPSHOT_CACHE.clear()
+        builtin_metrics_tool._SNAPSHOT_INFLIGHT.clear()
+
+    async def test_repeated_snapshot_lookup_is_served_from_cache(self):
+        calls = []
+
+        def fake_sync(self, symbol, market):
+            calls.append((symbol, market))
+            return _calc_payload(symbol, market)
+
+        with patch.object(BuiltinMetricsTool, "_calc_indexes_sync", fake_sync):
+            first = await _make_tool().execute(action="calc_indexes", symbol="AAPL")
+            second = await _make_tool().execute(action="calc_indexes", symbol="aapl")
+
+        self.assertEqual(calls, [("AAPL", "US")])
+        self.assertEqual(first, second)
+        second["metrics"]["trailing_pe"] = 0.0
+        third = await _make_tool().execute(action="calc_indexes", symbol="AAPL")
+        self.assertEqual(third["metrics"]["trailing_pe"], 20.0)
+
+    async def test_concurrent_snapshot_lookups_share_one_fetch(self):
+        calls = []
+
+        def fake_sync(self, symbol, market):
+            calls.append(symbol)
+            return _calc_payload(symbol, market)
+
+        tool = _make_tool()
+        with patch.object(BuiltinMetricsTool, "_calc_indexes_sync", fake_sync):
+            results = await asyncio.gather(
+                *[tool.execute(action="calc_indexes", symbol="MSFT") for _ in range(3)]
+            )
+
+        self.assertEqual(calls, ["MSFT"])
+        self.assertEqual(len({r["symbol"] for r in results}), 1)
+
+    async def test_snapshot_cache_is_not_shared_across_credentials(self):
+        calls = []
+
+        def fake_sync(self, symbol, market):
+            calls.append(self._lb_config.app_key)
+            return _calc_payload(symbol, market)
+
+        with patch.object(BuiltinMetricsTool, "_calc_indexes_sync", fake_sync):
+            await _make_tool("user-a").execute(action="calc_indexes", symbol="AAPL")
+            await _make_tool("user-b").execute(action="calc_indexes", symbol="AAPL")
+            await _make_tool("user-a").execute(action="calc_indexes", symbol="AAPL")
+
+        self.assertEqual(calls, ["user-a", "user-b"])
+
+    async def test_snapshot_cache_evicts_least_recently_used(self):
+        calls = []
+
+        def fake_sync(self, symbol, market):
+            calls.append(symbol)
+            return _calc_payload(symbol, market)
+
+        tool = _make_tool()
+        with patch.object(builtin_metrics_tool, "_SNAPSHOT_MAX_ENTRIES", 2), patch.object(
+            BuiltinMetricsTool, "_calc_indexes_sync", fake_sync
+        ):
+            for symbol in ("AAPL", "MSFT", "AAPL", "NVDA", "AAPL", "MSFT"):
+                await tool.execute(action="calc_indexes", symbol=symbol)
+
+        self.assertEqual(calls, ["AAPL", "MSFT", "NVDA", "MSFT"])
+
+    async def test_degraded_snapshot_is_not_cached(self):
+        calls = []
+
+        def fake_sync(self, symbol, market):
+            calls.append(symbol)
+            return _calc_payload(symbol, market, warnings=["empty_calc_indexes"])
+
+        with patch.object(BuiltinMetricsTool, "_calc_indexes_sync", fake_sync):
+            await _make_tool().execute(action="calc_indexes", symbol="TSLA")
+            await _make_tool().execute(action="calc_indexes", symbol="TSLA")
+
+        self.assertEqual(calls, ["TSLA", "TSLA"])
+
+    async def test_cancelled_leader_lets_followers_refetch(self):
+        calls = []
+        leader_started = asyncio.Event()
+
+        async def fake_candlesticks(self, symbol, market, kwargs):
+            del kwargs
+            calls.append(symbol)
+            if len(calls) == 1:
+                leader_started.set()
+                await asyncio.sleep(5)
+            return {"action": "candlesticks", "symbol": symbol, "warnings": []}
+
+        with patch.object(BuiltinMetricsTool, "_candlesticks", fake_candlesticks):
+            tool = _make_tool()
+            leader = asyncio.ensure_future(
+                tool.execute(action="candlesticks", symbol="AAPL")
+            )
+            await leader_started.wait()
+            follower = asyncio.ensure_future(
+                tool.execute(action="candlesticks", symbol="AAPL")
+            )
+            await asyncio.sleep(0)
+            leader.cancel()
+            result = await asyncio.wait_for(follower, timeout=1)
+
+        self.assertEqual(result["symbol"], "AAPL")
+        self.assertEqual(calls, ["AAPL", "AAPL"])
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+
+
+class BuiltinMetricsToolCandlesticksTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        builtin_metrics_tool._SNAPSHOT_CACHE.clear()
+        builtin_metrics_tool._SNAPSHOT_INFLIGHT.clear()
+
+    async def test_identical_candlestick_windows_are_cached(self):
+        seen = []
+
+        def fake_sync(self, symbol, market, interval, count, start, end):
+            seen.append((interval, count))
+            return {"action": "candlesticks", "interval": interval, "bars": [], "warnings": []}
+
+        with patch.object(BuiltinMetricsTool, "_candlesticks_sync", fake_sync):
+            await _make_tool().execute(action="candlesticks", symbol="AAPL", interval="1d")
+            await _make_tool().execute(
+                action="candlesticks", symbol="AAPL", interval="1d", count=200
+            )
+            await _make_tool().execute(action="candlesticks", symbol="AAPL", interval="5m")
+
+        self.assertEqual(seen, [("1d", 200), ("5m", 200)])
+
+    async def test_unsupported_interval_falls_back_to_daily_label(self):
+        seen = []
+
+        def fake_sync(self, symbol, market, interval, count, start, end):
+            seen.append((interval, count))
+            return {"action": "candlesticks", "interval": interval, "warnings": []}
+
+        with patch.object(BuiltinMetricsTool, "_candlesticks_sync", fake_sync):
+            await _make_tool().execute(action="candlesticks", symbol="AAPL", interval="2h")
+            await _make_tool().execute(
+                action="candlesticks", symbol="AAPL", interval="1M", count=900
+            )
+
+        self.assertEqual(seen, [("1d", 200), ("1M", 500)])
+
+
+class BuiltinMetricsToolDispatchTest(unittest.IsolatedAsyncioTestCase):
+    async def test_unknown_action_is_rejected_before_symbol_resolution(self):
+        with patch.object(
+            builtin_metrics_tool, "infer_market_from_symbol", side_effect=AssertionError
+        ):
+            result = await _make_tool().execute(action="Depth", symbol="AAPL")
+
+        self.assertEqual(result["warnings"], ["error:Unknown action: depth"])
+
+
+class _FakeQuoteContext:
+    def __init__(self, config) -> None:
+        del config
+
+    def calc_indexes(self, symbols, indexes):
+        del symbols, indexes
+        return [
+            SimpleNamespace(
+                pe_ttm_ratio="28.5",
+                pb_ratio=None,
+                total_market_value=3.1e12,
+                dividend_ratio_ttm=0.5,
+                turnover_rate=0.8,
+                volume_ratio=1.2,
+            )
+        ]
+
+    def static_info(self, symbols):
+        del symbols
+        return [
+            SimpleNamespace(
+                name_cn="苹果",
+                name_en="Apple Inc.",
+                name_hk=None,
+                listing_date="1980-12-12",
+                total_shares=15e9,
+                circulating_shares="14.9e9",
+                eps_ttm=6.1,
+                bps=None,
+                dividend_yield=0.44,
+            )
+        ]
+
+
+def _fake_openapi():
+    calc_index = SimpleNamespace(
+        PeTtmRatio=1,
+        PbRatio=2,
+        TotalMarketValue=3,
+        DividendRatioTtm=4,
+        TurnoverRate=5,
+        VolumeRatio=6,
+    )
+    openapi = SimpleNamespace(
+        CalcIndex=calc_index,
+        Config=lambda **kwargs: kwargs,
+        QuoteContext=_FakeQuoteContext,
+    )
+    return {"longbridge": SimpleNamespace(openapi=openapi), "longbridge.openapi": openapi}
+
+
+class BuiltinMetricsToolSnapshotFieldsTest(unittest.TestCase):
+    def setUp(self):
+        lb_context._CONTEXTS.clear()
+        builtin_metrics_tool._calc_index_members.cache_clear()
+
+    def test_calc_indexes_maps_sdk_fields(self):
+        with patch.dict("sys.modules", _fake_openapi()):
+            payload = _make_tool()._calc_indexes_sync("AAPL", "US")
+
+        self.assertEqual(
+            payload["metrics"],
+            {
+                "trailing_pe": 28.5,
+                "pb_ratio": None,
+                "market_cap": 3.1e12,
+                "dividend_ratio_ttm": 0.5,
+                "turnover_rate": 0.8,
+                "volume_ratio": 1.2,
+            },
+        )
+        self.assertEqual(payload["warnings"], [])
+
+    def test_calc_index_members_are_resolved_once(self):
+        with patch.dict("sys.modules", _fake_openapi()):
+            members = builtin_metrics_tool._calc_index_members()
+
+        # Outside the patch the fake SDK is gone; the cached tuple is reused.
+        self.assertEqual(members, (1, 2, 3, 4, 5, 6))
+        self.assertIs(builtin_metrics_tool._calc_index_members(), members)
+
+    def test_calc_indexes_without_values_is_flagged_empty(self):
+        class _BlankContext(_FakeQuoteContext):
+            def calc_indexes(self, symbols, indexes):
+                del symbols, indexes
+                return [SimpleNamespace(pe_ttm_ratio=None, pb_ratio=float("nan"))]
+
+        fake_modules = _fake_openapi()
+        fake_modules["longbridge.openapi"].QuoteContext = _BlankContext
+        with patch.dict("sys.modules", fake_modules):
+            payload = _make_tool()._calc_indexes_sync("AAPL", "US")
+
+        self.assertEqual(set(payload["metrics"].values()), {None})
+        self.assertEqual(payload["warnings"], ["empty_calc_indexes"])
+
+    def test_static_info_maps_sdk_fields(self):
+        with patch.dict("sys.modules", _fake_openapi()):
+            payload = _make_tool()._static_info_sync("AAPL", "US")
+
+        info = payload["info"]
+        self.assertEqual(info["name_en"], "Apple Inc.")
+        self.assertEqual(info["name_hk"], "")
+        self.assertEqual(info["circulating_shares"], 14.9e9)
+        self.assertIsNone(info["bps"])
+
+
+class BuiltinMetricsToolBatchingTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        builtin_metrics_tool._SNAPSHOT_CACHE.clear()
+        builtin_metrics_tool._SNAPSHOT_INFLIGHT.clear()
+        lb_context._CONTEXTS.clear()
+
+    async def test_concurrent_symbols_share_one_static_info_request(self):
+        requests = []
+
+        class _RecordingContext(_FakeQuoteContext):
+            def static_info(self, symbols):
+                requests.append(list(symbols))
+                # Records come back keyed by symbol, not in request order.
+                return [
+                    SimpleNamespace(symbol=symbol, name_en=symbol.split(".")[0])
+                    for symbol in reversed(symbols)
+                    if symbol != "ZZZZ.US"
+                ]
+
+        fake_modules = _fake_openapi()
+        fake_modules["longbridge.openapi"].QuoteContext = _RecordingContext
+        tool = _make_tool()
+        with patch.dict("sys.modules", fake_modules):
+            results = await asyncio.gather(
+                *[
+                    tool.execute(action="static_info", symbol=symbol)
+                    for symbol in ("AAPL", "MSFT", "ZZZZ")
+                ]
+            )
+
+        self.assertEqual(requests, [["AAPL.US", "MSFT.US", "ZZZZ.US"]])
+        self.assertEqual(
+            [r["info"].get("name_en") for r in results], ["AAPL", "MSFT", None]
+        )
+        self.assertEqual([r["warnings"] for r in results], [[], [], ["empty_static_info"]])
+
+    async def test_failed_merged_static_info_warns_each_caller(self):
+        class _FailingContext(_FakeQuoteContext):
+            def static_info(self, symbols):
+                raise RuntimeError(f"bad symbol in {len(symbols)}")
+
+        fake_modules = _fake_openapi()
+        fake_modules["longbridge.openapi"].QuoteContext = _FailingContext
+        tool = _make_tool()
+        with patch.dict("sys.modules", fake_modules):
+            results = await asyncio.gather(
+                *[
+                    tool.execute(action="static_info", symbol=symbol)
+                    for symbol in ("AAPL", "MSFT")
+                ]
+            )
+
+        self.assertEqual(
+            [r["warnings"] for r in results],
+            [["static_info_failed:bad symbol in 2"]] * 2,
+        )
+
+    async def test_cancelled_batch_resolves_waiters(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_many(self, items):
+            started.set()
+            release.wait(timeout=1)
+            return [{"symbol": symbol} for symbol, _ in items]
+
+        tool = _make_tool()
+        batcher = tool._batchers["static_info"]
+        with patch.object(BuiltinMetricsTool, "_static_info_many_sync", blocking_many):
+            waiters = [
+                asyncio.ensure_future(batcher.fetch(symbol, "US"))
+                for symbol in ("AAPL", "MSFT")
+            ]
+            while not batcher._tasks:
+                await asyncio.sleep(0.001)
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 1)
+            for task in list(batcher._tasks):
+                task.cancel()
+            results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+            release.set()
+
+        self.assertEqual(
+            [(r["symbol"], r["source"]) for r in results],
+            [("AAPL", "error"), ("MSFT", "error")],
+        )
+
+
+    async def test_symbols_argument_fetches_peers_in_one_request(self):
+        requests = []
+
+        class _RecordingContext(_FakeQuoteContext):
+            def calc_indexes(self, symbols, indexes):
+                del indexes
+                requests.append(list(symbols))
+                return [
+                    SimpleNamespace(symbol=symbol, pe_ttm_ratio=float(len(requests)))
+                    for symbol in symbols
+                    if symbol != "NVDA.US"
+                ]
+
+        fake_modules = _fake_openapi()
+        fake_modules["longbridge.openapi"].QuoteContext = _RecordingContext
+        with patch.dict("sys.modules", fake_modules):
+            result = await _make_tool().execute(
+                action="calc_indexes", symbol="AAPL", symbols=["MSFT", "aapl", "NVDA", ""]
+            )
+
+        self.assertEqual(requests, [["AAPL.US", "MSFT.US", "NVDA.US"]])
+        self.assertEqual(
+            [(r["symbol"], r["metrics"].get("trailing_pe")) for r in result["results"]],
+            [("AAPL", 1.0), ("MSFT", 1.0), ("NVDA", None)],
+        )
+        self.assertEqual(result["warnings"], ["NVDA:empty_calc_indexes"])
+
+
+class BuiltinMetricsToolContextTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        builtin_metrics_tool._SNAPSHOT_CACHE.clear()
+        builtin_metrics_tool._SNAPSHOT_INFLIGHT.clear()
+        lb_context._CONTEXTS.clear()
+
+    async def test_quote_context_is_shared_until_a_connection_error(self):
+        contexts = []
+
+        class _CountingContext(_FakeQuoteContext):
+            def __init__(self, config) -> None:
+                super().__init__(config)
+                contexts.append(self)
+
+            def intraday(self, symbol):
+                if symbol == "DOWN.US":
+                    raise ConnectionResetError("socket closed")
+                return []
+
+        fake_modules = _fake_openapi()
+        fake_modules["longbridge.openapi"].QuoteContext = _CountingContext
+        tool = _make_tool()
+        with patch.dict("sys.modules", fake_modules):
+            await tool.execute(action="static_info", symbol="AAPL")
+            await _make_tool().execute(action="calc_indexes", symbol="AAPL")
+            self.assertEqual(len(contexts), 1)
+
+            failed = await tool.execute(action="intraday", symbol="DOWN")
+            await tool.execute(action="intraday", symbol="AAPL")
+
+        self.assertEqual(failed["warnings"], ["error:socket closed"])
+        self.assertEqual(len(contexts), 2)
+
+
+    async def test_sdk_session_error_rebuilds_the_context(self):
+        class OpenApiException(Exception):
+            pass
+
+        contexts = []
+
+        class _ExpiringContext(_FakeQuoteContext):
+            def __init__(self, config) -> None:
+                super().__init__(config)
+                contexts.append(self)
+
+            def intraday(self, symbol):
+                if len(contexts) == 1:
+                    raise OpenApiException("session expired")
+                return []
+
+        fake_modules = _fake_openapi()
+        fake_modules["longbridge.openapi"].QuoteContext = _ExpiringContext
+        fake_modules["longbridge.openapi"].OpenApiException = OpenApiException
+        tool = _make_tool()
+        with patch.dict("sys.modules", fake_modules):
+            failed = await tool.execute(action="intraday", symbol="AAPL")
+            recovered = await tool.execute(action="intraday", symbol="AAPL")
+
+        self.assertEqual(failed["warnings"], ["error:session expired"])
+        self.assertNotIn("error:session expired", recovered["warnings"])
+        self.assertEqual(len(contexts), 2)
+
+
+class LongbridgeExecutorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_calls_run_on_the_capped_longbridge_pool(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        names = set()
+
+        def blocking_call(value):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                names.add(threading.current_thread().name)
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return value
+
+        results = await asyncio.gather(
+            *[builtin_metrics_tool._to_thread_limited(blocking_call, i) for i in range(8)]
+        )
+
+        self.assertEqual(results, list(range(8)))
+        self.assertLessEqual(state["peak"], builtin_metrics_tool._LB_MAX_CONCURRENCY)
+        self.assertTrue(all(name.startswith("longbridge-metrics") for name in names))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from market_reporter.config import LongbridgeConfig
+from market_reporter.core.types import NewsItem
+from market_reporter.modules.analysis.agent.tools import builtin_news_tool
+from market_reporter.modules.analysis.agent.tools.builtin_news_tool import (
+    BuiltinNewsTool,
+)
+
+
+class _BlockingNewsService:
+    """News service that only returns once the web search has started."""
+
+    def __init__(self, web_started: asyncio.Event) -> None:
+        self.web_started = web_started
+
+    async def collect(self, limit: int):
+        del limit
+        await asyncio.wait_for(self.web_started.wait(), timeout=1)
+        return (
+            [
+                NewsItem(
+                    category="finance",
+                    source="Reuters",
+                    title="Fed holds rates steady",
+                    link="https://example.com/fed",
+                    published="2026-02-20T08:00:00+00:00",
+                )
+            ],
+            ["provider_slow", "provider_slow"],
+        )
+
+
+class BuiltinNewsToolTest(unittest.IsolatedAsyncioTestCase):
+    async def test_rss_and_web_search_run_concurrently(self):
+        web_started = asyncio.Event()
+        tool = BuiltinNewsTool(news_service=_BlockingNewsService(web_started))
+
+        async def fake_web(self, query, limit=10, from_date=None, to_date=None):
+            del self, query, limit, from_date, to_date
+            web_started.set()
+            return []
+
+        with patch.object(BuiltinNewsTool, "_search_web_sync", fake_web):
+            result = await tool.execute(query="fed rates")
+
+        self.assertEqual(len(result["items"]), 1)
+        self.assertEqual(result["warnings"], ["provider_slow", "no_web_results"])
+
+    async def test_web_search_is_skipped_when_disabled(self):
+        tool = BuiltinNewsTool(news_service=None)
+
+        async def fail_web(self, *args, **kwargs):
+            raise AssertionError("web search should not run")
+
+        with patch.object(BuiltinNewsTool, "_search_web_sync", fail_web):
+            result = await tool.execute(query="fed", include_web=False)
+
+        self.assertEqual(result["web_results"], [])
+        self.assertEqual(result["warnings"], ["rss_unavailable"])
+
+    async def test_web_search_is_skipped_for_symbol_only_queries(self):
+        tool = BuiltinNewsTool(news_service=None)
+
+        async def fail_web(self, *args, **kwargs):
+            raise AssertionError("web search should not run")
+
+        with patch.object(BuiltinNewsTool, "_search_web_sync", fail_web):
+            result = await tool.execute(query="  ", symbol="AAPL")
+
+        self.assertEqual(result["query"], "AAPL")
+        self.assertEqual(result["warnings"], ["rss_unavailable"])
+
+    async def test_explicit_include_web_searches_symbol_only_queries(self):
+        tool = BuiltinNewsTool(news_service=None)
+        queries = []
+
+        async def fake_web(self, query, limit=10, from_date=None, to_date=None):
+            del self, limit, from_date, to_date
+            queries.append(query)
+            return [{"title": "Apple earnings"}]
+
+        with patch.object(BuiltinNewsTool, "_search_web_sync", fake_web):
+            result = await tool.execute(query="", symbol="AAPL", include_web=True)
+
+        self.assertEqual(queries, ["AAPL"])
+        self.assertEqual(result["web_results"], [{"title": "Apple earnings"}])
+
+    async def test_alias_lookup_overlaps_news_collect(self):
+        alias_started = asyncio.Event()
+        tool = BuiltinNewsTool(news_service=_BlockingNewsService(alias_started))
+
+        async def fake_aliases(self, symbol, market):
+            del self, symbol, market
+            alias_started.set()
+            return ["Federal Reserve"]
+
+        with patch.object(BuiltinNewsTool, "_resolve_company_aliases", fake_aliases):
+            result = await tool.execute(symbol="FED", market="US", include_web=False)
+
+        self.assertEqual(
+            [item["title"] for item in result["items"]], ["Fed holds rates steady"]
+        )
+        self.assertEqual(result["warnings"], ["provider_slow"])
+
+    async def test_concurrent_searches_share_one_news_collect(self):
+        calls = []
+        release = asyncio.Event()
+
+        class _CountingNewsService:
+            async def collect(self, limit: int):
+                calls.append(limit)
+                await release.wait()
+                return (
+                    [
+                        NewsItem(
+                            category="finance",
+                            source="Reuters",
+                            title="Fed holds rates steady",
+                            link="https://example.com/fed",
+                            published="2026-02-20T08:00:00+00:00",
+                        )
+                    ],
+                    [],
+                )
+
+        tool = BuiltinNewsTool(news_service=_CountingNewsService())
+        tasks = [
+            asyncio.create_task(tool.execute(query=query, include_web=False))
+            for query in ("fed", "rates", "oil")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual(calls, [100])
+        self.assertEqual([len(r["items"]) for r in results], [1, 1, 0])
+
+        await tool.execute(query="fed", include_web=False)
+        self.assertEqual(calls, [100, 100])
+
+    def test_fallback_headlines_put_undated_items_last(self):
+        def item(title: str, published: str) -> NewsItem:
+            return NewsItem(
+                category="finance",
+                source="Reuters",
+                title=title,
+                link=f"https://example.com/{title}",
+                published=published,
+            )
+
+        rows = [item("undated", ""), item("old", "2026-02-19"), item("new", "2026-02-20")]
+        filtered = [(row, BuiltinNewsTool._parse_date(row.published)) for row in rows]
+
+        ordered = BuiltinNewsTool._fallback_recent_headlines(filtered)
+
+        self.assertEqual([row.title for row in ordered], ["new", "old", "undated"])
+
+    def test_parse_date_accepts_iso_and_rfc2822(self):
+        expected = datetime(2026, 2, 20, 8, 0, tzinfo=timezone.utc)
+        for text in (
+            "2026-02-20T08:00:00Z",
+            "2026-02-20T16:00:00+08:00",
+            "Fri, 20 Feb 2026 08:00:00 GMT",
+        ):
+            self.assertEqual(BuiltinNewsTool._parse_date(text), expected)
+        self.assertIsNone(BuiltinNewsTool._parse_date("not a date"))
+        self.assertIsNone(BuiltinNewsTool._parse_range_end("2026-13-01"))
+
+    def test_parse_date_reuses_parsed_values(self):
+        text = "Sat, 21 Feb 2026 09:30:00 GMT"
+        first = BuiltinNewsTool._parse_date(text)
+        hits = builtin_news_tool._parse_date_text.cache_info().hits
+
+        self.assertIs(BuiltinNewsTool._parse_date(f"  {text} "), first)
+        self.assertEqual(builtin_news_tool._parse_date_text.cache_info().hits, hits + 1)
+
+    def test_entry_published_reuses_feedparser_struct_time(self):
+        entry = builtin_news_tool.feedparser.parse(_BING_RSS).entries[0]
+
+        def fail_parse(value):
+            raise AssertionError(f"reparsed {value!r}")
+
+        with patch.object(BuiltinNewsTool, "_parse_date", staticmethod(fail_parse)):
+            published = BuiltinNewsTool._entry_published(entry)
+
+        self.assertEqual(published, datetime(2026, 2, 20, 8, 0, tzinfo=timezone.utc))
+
+    async def test_web_search_fetches_through_async_http_client(self):
+        class _RssClient:
+            def __init__(self) -> None:
+                self.urls = []
+
+            async def get_text(self, url, params=None):
+                del params
+                self.urls.append(url)
+                return _BING_RSS
+
+        client = _RssClient()
+        news_service = type("_NewsService", (), {"client": client})()
+        tool = BuiltinNewsTool(news_service=news_service)
+
+        def fail_thread(*args, **kwargs):
+            raise AssertionError("blocking fetch should not run")
+
+        with patch.object(BuiltinNewsTool, "_do_web_search", fail_thread):
+            items = await tool._search_web_sync("fed rates", limit=5)
+
+        self.assertEqual(
+            client.urls, ["https://www.bing.com/search?q=fed+rates&format=rss"]
+        )
+        self.assertEqual([item["title"] for item in items], ["Fed holds rates"])
+        self.assertEqual(items[0]["published_at"], "2026-02-20T08:00:00+00:00")
+
+
+_BING_RSS = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Bing</title>
+<item><title>Fed holds rates</title><link>https://example.com/fed</link>
+<description>Policy unchanged.</description>
+<pubDate>Fri, 20 Feb 2026 08:00:00 GMT</pubDate></item>
+</channel></rss>
+"""
+
+
+class BuiltinNewsToolAliasCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        builtin_news_tool._ALIAS_CACHE.clear()
+
+    async def test_aliases_are_shared_across_instances_and_failures_retry(self):
+        calls = []
+
+        def fake_load(self, symbol, market):
+            calls.append((symbol, market))
+            if len(calls) == 1:
+                raise RuntimeError("longbridge down")
+            return ["Apple Inc."]
+
+        lb_config = LongbridgeConfig(
+            enabled=True, app_key="key", app_secret="secret", access_token="token"
+        )
+        with patch.object(BuiltinNewsTool, "_load_company_aliases_longbridge", fake_load):
+            first = await BuiltinNewsTool(lb_config=lb_config)._resolve_company_aliases(
+                "aapl", "us"
+            )
+            second = await BuiltinNewsTool(lb_config=lb_config)._resolve_company_aliases(
+                "AAPL", "US"
+            )
+            third = await BuiltinNewsTool(lb_config=lb_config)._resolve_company_aliases(
+                "AAPL", "US"
+            )
+
+        self.assertEqual(first, [])
+        self.assertEqual(second, ["Apple Inc."])
+        self.assertEqual(third, ["Apple Inc."])
+        self.assertEqual(calls, [("AAPL", "US"), ("AAPL", "US")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -53,6 +53,23 @@ class AgentReportFormatterTest(unittest.TestCase):
         self.assertIn("缩量回调: 是", text)
         self.assertNotIn("{'low':", text)
 
+    def test_indicator_table_tolerates_malformed_sections(self):
+        text = AgentReportFormatter._build_indicator_table(
+            mode="stock",
+            tool_results={
+                "compute_indicators": {
+                    "trend": {"primary": {"ma": "bullish", "macd": {"cross": "golden"}}},
+                    "momentum": ["not", "a", "dict"],
+                    "strategy": {"score": 61.5},
+                }
+            },
+        )
+
+        self.assertIn("| 趋势 | MA 状态 | N/A | 均线排列方向 |", text)
+        self.assertIn("| 趋势 | MACD | golden | MACD 交叉状态 |", text)
+        self.assertIn("| 动量 | RSI | N/A | N/A |", text)
+        self.assertIn("| 策略 | Score | 61.50 | N/A |", text)
+
     def test_build_fundamentals_skips_missing_metrics(self):
         text = AgentReportFormatter._build_fundamentals(
             mode="stock",
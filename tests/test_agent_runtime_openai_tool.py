@@ -347,6 +347,69 @@ class OpenAIToolRuntimeTest(unittest.TestCase):
         self.assertEqual(draft.summary, "coerced")
         self.assertAlmostEqual(draft.confidence, 0.8)
 
+    def test_runtime_runs_batched_tool_calls_concurrently_in_order(self):
+        provider_cfg = AnalysisProviderConfig(
+            provider_id="openai",
+            type="openai_compatible",
+            base_url="https://example.com/v1",
+            models=["gpt-test"],
+            timeout=10,
+            enabled=True,
+            auth_mode="api_key",
+        )
+
+        original_cls = openai_tool_runtime.ChatOpenAI
+        _FakeChatOpenAI.queued_responses = [
+            _FakeAIMessage(
+                tool_calls=[
+                    {
+                        "id": "tool_call_1",
+                        "name": "get_metrics",
+                        "args": {"action": "quote", "symbol": "AAPL"},
+                    },
+                    {
+                        "id": "tool_call_2",
+                        "name": "search_news",
+                        "args": {"query": "AAPL"},
+                    },
+                ]
+            ),
+        ]
+        openai_tool_runtime.ChatOpenAI = _FakeChatOpenAI
+
+        runtime = OpenAIToolRuntime(provider_config=provider_cfg, api_key="test-key")
+
+        async def scenario():
+            news_started = asyncio.Event()
+
+            async def executor(tool, arguments):
+                del arguments
+                if tool == "get_metrics":
+                    # Only completes if search_news runs while this call waits.
+                    await asyncio.wait_for(news_started.wait(), timeout=1)
+                else:
+                    news_started.set()
+                return {"tool": tool}
+
+            return await runtime.run(
+                model="gpt-test",
+                question="analyze",
+                mode="stock",
+                context={"x": 1},
+                tool_specs=[],
+                tool_executor=executor,
+                max_tool_calls=4,
+            )
+
+        try:
+            _, traces = asyncio.run(scenario())
+        finally:
+            openai_tool_runtime.ChatOpenAI = original_cls
+
+        self.assertEqual([trace.tool for trace in traces], ["get_metrics", "search_news"])
+        self.assertEqual(traces[0].result_preview, {"tool": "get_metrics"})
+        self.assertEqual(traces[1].result_preview, {"tool": "search_news"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from market_reporter.modules.analysis.agent.core.tool_protocol import ToolDefinition
+from market_reporter.modules.analysis.agent.core.tool_registry import ToolRegistry
+
+
+def _definition(name: str, idempotent: bool = True) -> ToolDefinition:
+    return ToolDefinition(
+        name=name,
+        description="test tool",
+        parameters={"type": "object", "properties": {}},
+        idempotent=idempotent,
+    )
+
+
+class ToolRegistrySingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_concurrent_calls_share_one_execution(self):
+        calls = []
+        release = asyncio.Event()
+
+        async def executor(**kwargs):
+            calls.append(kwargs)
+            await release.wait()
+            return {"symbol": kwargs["symbol"], "rows": [1, 2]}
+
+        registry = ToolRegistry()
+        registry.register(_definition("get_metrics"), executor)
+
+        first = asyncio.create_task(
+            registry.execute("get_metrics", {"symbol": "AAPL", "market": "US"})
+        )
+        second = asyncio.create_task(
+            registry.execute("GET_METRICS", {"market": "US", "symbol": "AAPL"})
+        )
+        other = asyncio.create_task(
+            registry.execute("get_metrics", {"symbol": "MSFT", "market": "US"})
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second, other)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(results[0], results[1])
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(results[2]["symbol"], "MSFT")
+
+        await registry.execute("get_metrics", {"symbol": "AAPL", "market": "US"})
+        self.assertEqual(len(calls), 3)
+
+    async def test_errors_propagate_to_every_waiter(self):
+        release = asyncio.Event()
+
+        async def executor(**kwargs):
+            del kwargs
+            await release.wait()
+            raise RuntimeError("upstream down")
+
+        registry = ToolRegistry()
+        registry.register(_definition("search_news"), executor)
+
+        tasks = [
+            asyncio.create_task(registry.execute("search_news", {"query": "fed"}))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    async def test_tools_not_marked_idempotent_run_every_call(self):
+        calls = []
+        release = asyncio.Event()
+
+        async def executor(**kwargs):
+            calls.append(kwargs)
+            await release.wait()
+            return {"ok": True}
+
+        registry = ToolRegistry()
+        registry.register(_definition("place_order", idempotent=False), executor)
+
+        tasks = [
+            asyncio.create_task(registry.execute("place_order", {"symbol": "AAPL"}))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+
+from market_reporter.modules.market_data.providers.akshare_provider import (
+    AkshareMarketDataProvider,
+)
+
+
+def _daily_hist(symbol: str, period: str, adjust: str):
+    del symbol, period, adjust
+    return pd.DataFrame(
+        {
+            "日期": ["2026-02-19", "2026-02-20", "2026-02-23"],
+            "开盘": [10.0, 10.5, 10.8],
+            "最高": [10.6, 11.0, 11.2],
+            "最低": [9.9, 10.4, 10.7],
+            "收盘": [10.5, 10.8, 11.1],
+            "成交量": [1000, 1500, 1800],
+        }
+    )
+
+
+class AkshareProviderKlineTest(unittest.IsolatedAsyncioTestCase):
+    async def test_get_kline_builds_bars_from_frame_columns(self):
+        fake_module = SimpleNamespace(stock_zh_a_hist=_daily_hist)
+        with patch.dict("sys.modules", {"akshare": fake_module}):
+            provider = AkshareMarketDataProvider()
+            bars = await provider.get_kline("600519", "cn", interval="1d", limit=2)
+
+        self.assertEqual([bar.ts for bar in bars], ["2026-02-20", "2026-02-23"])
+        self.assertEqual(bars[0].symbol, "600519.SH")
+        self.assertEqual(bars[0].market, "CN")
+        self.assertEqual(
+            (bars[1].open, bars[1].high, bars[1].low, bars[1].close, bars[1].volume),
+            (10.8, 11.2, 10.7, 11.1, 1800.0),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
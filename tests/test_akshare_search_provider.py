@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+
+from market_reporter.modules.symbol_search.providers.akshare_search_provider import (
+    AkshareSearchProvider,
+)
+
+
+def _hk_spot():
+    return pd.DataFrame(
+        {
+            "代码": [700, 9988, 3690],
+            "名称": ["腾讯控股", "阿里巴巴-W", "美团-W"],
+        }
+    )
+
+
+def _us_spot():
+    return pd.DataFrame(
+        {
+            "代码": ["BRK.B", "BRKXB", "AAPL"],
+            "名称": ["Berkshire Hathaway B", "Other", "Apple"],
+        }
+    )
+
+
+class AkshareSearchProviderTest(unittest.IsolatedAsyncioTestCase):
+    async def test_hk_search_pads_codes_and_scores_matches(self):
+        fake_module = SimpleNamespace(stock_hk_spot_em=_hk_spot)
+        with patch.dict("sys.modules", {"akshare": fake_module}):
+            rows = await AkshareSearchProvider().search("0700", "HK", limit=5)
+
+        self.assertEqual([row.symbol for row in rows], ["0700.HK"])
+        self.assertEqual(rows[0].name, "腾讯控股")
+        self.assertEqual(rows[0].exchange, "HKEX")
+        self.assertEqual(rows[0].score, 0.95)
+
+    async def test_query_is_matched_literally(self):
+        fake_module = SimpleNamespace(stock_us_spot_em=_us_spot)
+        with patch.dict("sys.modules", {"akshare": fake_module}):
+            rows = await AkshareSearchProvider().search("brk.b", "US", limit=5)
+
+        self.assertEqual([row.symbol for row in rows], ["BRK.B"])
+
+
+if __name__ == "__main__":
+    unittest.main()
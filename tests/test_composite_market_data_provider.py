@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from market_reporter.core.types import Quote
+from market_reporter.modules.market_data.providers import composite_provider
+from market_reporter.modules.market_data.providers.composite_provider import (
+    CompositeMarketDataProvider,
+)
+
+
+class _ConcurrentQuoteProvider:
+    provider_id = "yfinance"
+
+    def __init__(self, expected: int) -> None:
+        self.started = 0
+        self.expected = expected
+        self.all_started = asyncio.Event()
+
+    async def get_quote(self, symbol: str, market: str) -> Quote:
+        self.started += 1
+        if self.started >= self.expected:
+            self.all_started.set()
+        # Only returns once every single-quote lookup is in flight.
+        await asyncio.wait_for(self.all_started.wait(), timeout=1)
+        if symbol == "BAD":
+            raise RuntimeError("no data")
+        return Quote(
+            symbol=symbol,
+            market=market,
+            ts="2026-02-20T00:00:00+00:00",
+            price=1.0,
+            change=None,
+            change_percent=None,
+            volume=None,
+            currency="USD",
+            source=self.provider_id,
+        )
+
+
+class _FailingProvider:
+    provider_id = "akshare"
+
+    async def get_quote(self, symbol: str, market: str) -> Quote:
+        raise RuntimeError("unsupported")
+
+
+class CompositeProviderQuotesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_single_quote_fallbacks_run_concurrently(self):
+        primary = _ConcurrentQuoteProvider(expected=3)
+        provider = CompositeMarketDataProvider(
+            providers={"yfinance": primary, "akshare": _FailingProvider()},
+        )
+
+        quotes = await provider.get_quotes([("AAPL", "US"), ("BAD", "US"), ("MSFT", "US")])
+
+        self.assertEqual([quote.symbol for quote in quotes], ["AAPL", "MSFT"])
+
+    async def test_single_quote_fallbacks_are_capped(self):
+        in_flight = []
+        peak = []
+
+        class _TrackingProvider:
+            provider_id = "yfinance"
+
+            async def get_quote(self, symbol: str, market: str) -> Quote:
+                in_flight.append(symbol)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.remove(symbol)
+                return _quote(symbol, self.provider_id)
+
+        provider = CompositeMarketDataProvider(
+            providers={"yfinance": _TrackingProvider(), "akshare": _FailingProvider()},
+        )
+        items = [(f"SYM{index}", "US") for index in range(10)]
+
+        quotes = await provider.get_quotes(items)
+
+        self.assertEqual(len(quotes), 10)
+        self.assertEqual(max(peak), composite_provider._FALLBACK_CONCURRENCY)
+
+
+def _quote(symbol: str, source: str) -> Quote:
+    return Quote(
+        symbol=symbol,
+        market="US",
+        ts="2026-02-20T00:00:00+00:00",
+        price=1.0,
+        currency="USD",
+        source=source,
+    )
+
+
+class _SlowProvider:
+    provider_id = "yfinance"
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def get_quote(self, symbol: str, market: str) -> Quote:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return _quote(symbol, self.provider_id)
+
+
+class _FastProvider:
+    provider_id = "longbridge"
+
+    async def get_quote(self, symbol: str, market: str) -> Quote:
+        return _quote(symbol, self.provider_id)
+
+
+class CompositeProviderFailoverTest(unittest.IsolatedAsyncioTestCase):
+    async def test_next_provider_starts_only_after_the_slow_one_times_out(self):
+        slow = _SlowProvider()
+        started_after_timeout = []
+
+        class _RecordingProvider(_FastProvider):
+            async def get_quote(self, symbol: str, market: str) -> Quote:
+                started_after_timeout.append(slow.cancelled)
+                return await super().get_quote(symbol, market)
+
+        provider = CompositeMarketDataProvider(
+            providers={
+                "yfinance": slow,
+                "longbridge": _RecordingProvider(),
+                "akshare": _FailingProvider(),
+            },
+            provider_timeout=0.05,
+        )
+
+        quote = await asyncio.wait_for(provider.get_quote("AAPL", "US"), timeout=1)
+
+        self.assertEqual(quote.source, "longbridge")
+        self.assertEqual(started_after_timeout, [True])
+
+    async def test_failures_fall_through_to_the_next_provider(self):
+        provider = CompositeMarketDataProvider(
+            providers={
+                "yfinance": _FailingProvider(),
+                "longbridge": _FastProvider(),
+                "akshare": _FailingProvider(),
+            },
+        )
+
+        quote = await asyncio.wait_for(provider.get_quote("AAPL", "US"), timeout=1)
+
+        self.assertEqual(quote.source, "longbridge")
+
+    async def test_all_providers_failing_raises(self):
+        provider = CompositeMarketDataProvider(
+            providers={"yfinance": _FailingProvider(), "akshare": _FailingProvider()},
+        )
+
+        with self.assertRaises(ValueError):
+            await provider.get_quote("AAPL", "US")
+
+
+if __name__ == "__main__":
+    unittest.main()
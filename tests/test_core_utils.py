@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+from market_reporter.core import utils
+
+
+class UtcNowIsoTest(unittest.TestCase):
+    def test_matches_seconds_isoformat_and_reuses_text_within_a_second(self):
+        with patch.object(utils.time, "time", return_value=1767225600.25):
+            first = utils.utc_now_iso()
+        with patch.object(utils.time, "time", return_value=1767225600.9):
+            second = utils.utc_now_iso()
+        with patch.object(utils.time, "time", return_value=1767225601.0):
+            third = utils.utc_now_iso()
+
+        self.assertEqual(first, "2026-01-01T00:00:00+00:00")
+        self.assertIs(second, first)
+        self.assertEqual(third, "2026-01-01T00:00:01+00:00")
+
+
+class SilenceConsoleTest(unittest.TestCase):
+    def test_threads_are_silenced_concurrently_and_streams_restored(self):
+        original = sys.stdout
+        # Every worker must be inside the block at the same time, so a lock
+        # held across the body would time out the barrier.
+        barrier = threading.Barrier(4)
+        errors = []
+
+        def worker():
+            try:
+                with utils.silence_console():
+                    print("noise")
+                    barrier.wait(timeout=1)
+                    print("more noise")
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertIs(sys.stdout, original)
+        self.assertFalse(sys.stdout.closed)
+        self.assertEqual(utils._CONSOLE_DEPTH, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
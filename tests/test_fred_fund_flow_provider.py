@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from market_reporter.config import FRED_SERIES, AppConfig
+from market_reporter.modules.fund_flow.providers.fred_provider import (
+    FredFundFlowProvider,
+)
+
+
+class _ConcurrentCsvClient:
+    def __init__(self, expected: int) -> None:
+        self.started = 0
+        self.expected = expected
+        self.all_started = asyncio.Event()
+
+    async def get_text(self, url, params=None):
+        del url
+        self.started += 1
+        if self.started >= self.expected:
+            self.all_started.set()
+        # Only answers once every series download is in flight.
+        await asyncio.wait_for(self.all_started.wait(), timeout=1)
+        series_id = params["id"]
+        return f"DATE,{series_id}\n2025-07-01,1.5\n2025-10-01,.\n2026-01-01,\"2,000.25\"\n"
+
+
+class FredFundFlowProviderTest(unittest.IsolatedAsyncioTestCase):
+    async def test_series_are_fetched_concurrently_in_config_order(self):
+        client = _ConcurrentCsvClient(expected=len(FRED_SERIES))
+        provider = FredFundFlowProvider(config=AppConfig(), client=client)
+
+        result = await provider.collect(periods=2)
+
+        self.assertEqual(list(result), [series.key for series in FRED_SERIES])
+        for series in FRED_SERIES:
+            points = result[series.key]
+            self.assertEqual(
+                [(point.date, point.value) for point in points],
+                [("2025-07-01", 1.5), ("2026-01-01", 2000.25)],
+            )
+            self.assertEqual(points[0].series_name, series.display_name)
+
+    async def test_failed_series_is_raised_after_all_downloads_settle(self):
+        finished = []
+
+        class _OneFailingClient:
+            async def get_text(self, url, params=None):
+                del url
+                series_id = params["id"]
+                if series_id == FRED_SERIES[0].series_id:
+                    raise RuntimeError("fred down")
+                await asyncio.sleep(0.01)
+                finished.append(series_id)
+                return f"DATE,{series_id}\n2026-01-01,1.0\n"
+
+        provider = FredFundFlowProvider(config=AppConfig(), client=_OneFailingClient())
+
+        with self.assertRaisesRegex(RuntimeError, "fred down"):
+            await provider.collect(periods=2)
+
+        self.assertEqual(
+            sorted(finished), sorted(series.series_id for series in FRED_SERIES[1:])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from market_reporter.config import AppConfig
+from market_reporter.core.registry import ProviderRegistry
+from market_reporter.modules.fund_flow.service import FundFlowService
+
+
+class _Barrier:
+    def __init__(self, expected: int) -> None:
+        self.started = 0
+        self.expected = expected
+        self.all_started = asyncio.Event()
+
+
+class _GatedProvider:
+    def __init__(self, barrier: _Barrier, key: str, fail: bool = False) -> None:
+        self.barrier = barrier
+        self.key = key
+        self.fail = fail
+
+    async def collect(self, periods: int):
+        del periods
+        self.barrier.started += 1
+        if self.barrier.started >= self.barrier.expected:
+            self.barrier.all_started.set()
+        # Only returns once every provider collect is in flight.
+        await asyncio.wait_for(self.barrier.all_started.wait(), timeout=1)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return {self.key: []}
+
+
+class _FixedRegistry(ProviderRegistry):
+    def __init__(self, providers) -> None:
+        super().__init__()
+        self.providers = providers
+
+    def resolve(self, module: str, provider_id: str, **kwargs):  # type: ignore[override]
+        return self.providers[provider_id]
+
+
+class FundFlowServiceTest(unittest.IsolatedAsyncioTestCase):
+    async def test_providers_are_collected_concurrently(self):
+        barrier = _Barrier(expected=2)
+        config = AppConfig()
+        config.modules.fund_flow.providers = ["eastmoney", "fred"]
+        service = FundFlowService(
+            config=config,
+            client=None,
+            registry=_FixedRegistry(
+                {
+                    "eastmoney": _GatedProvider(barrier, "northbound", fail=True),
+                    "fred": _GatedProvider(barrier, "us_equity_etf_flow"),
+                }
+            ),
+        )
+
+        merged, warnings = await service.collect(periods=4)
+
+        self.assertEqual(list(merged), ["us_equity_etf_flow"])
+        self.assertEqual(
+            warnings, ["Fund-flow provider failed [eastmoney]: upstream down"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
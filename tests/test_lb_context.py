@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import unittest
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
+
+from market_reporter.config import LongbridgeConfig
+from market_reporter.modules.market_data import lb_context
+
+
+class _FakeQuoteContext:
+    def __init__(self, config) -> None:
+        self.config = config
+
+
+def _fake_openapi():
+    openapi = ModuleType("longbridge.openapi")
+    openapi.Config = lambda **kwargs: SimpleNamespace(**kwargs)
+    openapi.QuoteContext = _FakeQuoteContext
+    return {"longbridge": ModuleType("longbridge"), "longbridge.openapi": openapi}
+
+
+def _config(token: str) -> LongbridgeConfig:
+    return LongbridgeConfig(
+        enabled=True, app_key="key", app_secret="secret", access_token=token
+    )
+
+
+class QuoteContextCacheTest(unittest.TestCase):
+    def setUp(self):
+        lb_context._CONTEXTS.clear()
+
+    def test_rotated_credentials_replace_the_previous_context(self):
+        with patch.dict("sys.modules", _fake_openapi()):
+            first = lb_context.get_quote_context(_config("old"))
+            self.assertIs(lb_context.get_quote_context(_config("old")), first)
+            rotated = lb_context.get_quote_context(_config("new"))
+
+        self.assertIsNot(rotated, first)
+        self.assertEqual(rotated.config.access_token, "new")
+        self.assertEqual(len(lb_context._CONTEXTS), 1)
+
+    def test_sdk_and_socket_errors_count_as_context_errors(self):
+        class OpenApiException(Exception):
+            pass
+
+        modules = _fake_openapi()
+        modules["longbridge.openapi"].OpenApiException = OpenApiException
+        with patch.dict("sys.modules", modules):
+            self.assertTrue(lb_context.is_context_error(OpenApiException("expired")))
+            self.assertTrue(lb_context.is_context_error(ConnectionResetError()))
+            self.assertFalse(lb_context.is_context_error(ValueError("bad symbol")))
+
+    def test_reset_with_stale_credentials_keeps_the_rotated_context(self):
+        with patch.dict("sys.modules", _fake_openapi()):
+            lb_context.get_quote_context(_config("old"))
+            rotated = lb_context.get_quote_context(_config("new"))
+            lb_context.reset_quote_context(_config("old"))
+            self.assertIs(lb_context.get_quote_context(_config("new")), rotated)
+
+            lb_context.reset_quote_context(_config("new"))
+            reconnected = lb_context.get_quote_context(_config("new"))
+
+        self.assertIsNot(reconnected, rotated)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,10 +7,11 @@ from __future__ import annotations
 
 import unittest
 from datetime import datetime, timezone
-from types import SimpleNamespace
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from market_reporter.config import LongbridgeConfig
+from market_reporter.modules.market_data.providers import longbridge_provider
 from market_reporter.modules.market_data.providers.longbridge_provider import (
     LongbridgeMarketDataProvider,
 )
@@ -69,7 +70,7 @@ class LongbridgeProviderQuoteTest(unittest.IsolatedAsyncioTestCase):
         provider = LongbridgeMarketDataProvider(_make_lb_config())
         mock_ctx = MagicMock()
         mock_ctx.quote.return_value = [_make_quote()]
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         quote = await provider.get_quote("AAPL", "US")
 
@@ -88,7 +89,7 @@ class LongbridgeProviderQuoteTest(unittest.IsolatedAsyncioTestCase):
         provider = LongbridgeMarketDataProvider(_make_lb_config())
         mock_ctx = MagicMock()
         mock_ctx.quote.return_value = [_make_quote(last_done=18.5, prev_close=18.0)]
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         quote = await provider.get_quote("600519", "CN")
 
@@ -101,7 +102,7 @@ class LongbridgeProviderQuoteTest(unittest.IsolatedAsyncioTestCase):
         provider = LongbridgeMarketDataProvider(_make_lb_config())
         mock_ctx = MagicMock()
         mock_ctx.quote.return_value = [_make_quote(last_done=350.0, prev_close=345.0)]
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         quote = await provider.get_quote("0700", "HK")
 
@@ -129,7 +130,7 @@ class LongbridgeProviderQuoteTest(unittest.IsolatedAsyncioTestCase):
                 timestamp=datetime(2026, 2, 20, 10, 31, 0, tzinfo=timezone.utc),
             ),
         ]
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         rows = await provider.get_quotes([("AAPL", "US"), ("700", "HK")])
 
@@ -144,7 +145,7 @@ class LongbridgeProviderQuoteTest(unittest.IsolatedAsyncioTestCase):
         provider = LongbridgeMarketDataProvider(_make_lb_config())
         mock_ctx = MagicMock()
         mock_ctx.quote.return_value = [_make_quote(prev_close=None)]
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         quote = await provider.get_quote("AAPL", "US")
         self.assertIsNone(quote.change)
@@ -154,11 +155,32 @@ class LongbridgeProviderQuoteTest(unittest.IsolatedAsyncioTestCase):
         provider = LongbridgeMarketDataProvider(_make_lb_config())
         mock_ctx = MagicMock()
         mock_ctx.quote.return_value = []
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         with self.assertRaises(ValueError):
             await provider.get_quote("AAPL", "US")
 
+    async def test_sdk_session_error_resets_shared_context(self):
+        class OpenApiException(Exception):
+            pass
+
+        openapi = ModuleType("longbridge.openapi")
+        openapi.OpenApiException = OpenApiException
+        config = _make_lb_config()
+        provider = LongbridgeMarketDataProvider(config)
+        mock_ctx = MagicMock()
+        mock_ctx.quote.side_effect = OpenApiException("session expired")
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
+
+        with patch.dict(
+            "sys.modules",
+            {"longbridge": ModuleType("longbridge"), "longbridge.openapi": openapi},
+        ), patch.object(longbridge_provider, "reset_quote_context") as reset:
+            with self.assertRaises(OpenApiException):
+                await provider.get_quote("AAPL", "US")
+
+        reset.assert_called_once_with(config)
+
 
 class LongbridgeProviderKlineTest(unittest.IsolatedAsyncioTestCase):
     @patch(
@@ -182,7 +204,7 @@ class LongbridgeProviderKlineTest(unittest.IsolatedAsyncioTestCase):
                 timestamp=datetime(2026, 2, 21, 0, 0, 0, tzinfo=timezone.utc),
             ),
         ]
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         bars = await provider.get_kline("AAPL", "US", "1d", 10)
 
@@ -201,11 +223,23 @@ class LongbridgeProviderKlineTest(unittest.IsolatedAsyncioTestCase):
     async def test_get_kline_unsupported_interval(self, mock_map):
         mock_map.return_value = None
         provider = LongbridgeMarketDataProvider(_make_lb_config())
-        provider._ctx = MagicMock()
+        provider._ensure_ctx = MagicMock(return_value=MagicMock())
 
         with self.assertRaises(ValueError):
             await provider.get_kline("AAPL", "US", "3m", 10)
 
+    async def test_unsupported_interval_is_rejected_before_connecting(self):
+        provider = LongbridgeMarketDataProvider(_make_lb_config())
+
+        with patch.object(provider, "_ensure_ctx") as ensure_ctx, patch(
+            "asyncio.to_thread"
+        ) as to_thread:
+            with self.assertRaises(ValueError):
+                await provider.get_kline("AAPL", "US", "3m", 10)
+
+        ensure_ctx.assert_not_called()
+        to_thread.assert_not_called()
+
 
 class LongbridgeProviderCurveTest(unittest.IsolatedAsyncioTestCase):
     async def test_get_curve_returns_points(self):
@@ -219,7 +253,7 @@ class LongbridgeProviderCurveTest(unittest.IsolatedAsyncioTestCase):
                 timestamp=datetime(2026, 2, 20, 10, 1, 0, tzinfo=timezone.utc),
             ),
         ]
-        provider._ctx = mock_ctx
+        provider._ensure_ctx = MagicMock(return_value=mock_ctx)
 
         points = await provider.get_curve("AAPL", "US", "1d")
 
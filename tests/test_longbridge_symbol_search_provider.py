@@ -1,8 +1,9 @@
 import unittest
-from types import SimpleNamespace
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from market_reporter.config import LongbridgeConfig
+from market_reporter.modules.symbol_search.providers import longbridge_search_provider
 from market_reporter.modules.symbol_search.providers.longbridge_search_provider import (
     LongbridgeSearchProvider,
 )
@@ -80,6 +81,29 @@ class LongbridgeSymbolSearchProviderTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(rows[0].symbol, "0700.HK")
         self.assertEqual(rows[0].market, "HK")
 
+    async def test_sdk_session_error_resets_shared_context(self):
+        class OpenApiException(Exception):
+            pass
+
+        openapi = ModuleType("longbridge.openapi")
+        openapi.OpenApiException = OpenApiException
+        config = _lb_config()
+        provider = LongbridgeSearchProvider(config)
+        mock_ctx = MagicMock()
+        mock_ctx.quote.side_effect = OpenApiException("session expired")
+        mock_ctx.static_info.side_effect = OpenApiException("session expired")
+
+        with patch.dict(
+            "sys.modules",
+            {"longbridge": ModuleType("longbridge"), "longbridge.openapi": openapi},
+        ), patch.object(provider, "_ensure_ctx", return_value=mock_ctx), patch.object(
+            longbridge_search_provider, "reset_quote_context"
+        ) as reset:
+            rows = await provider.search(query="AAPL", market="US", limit=10)
+
+        self.assertEqual(rows, [])
+        reset.assert_called_with(config)
+
     async def test_search_name_query_raises_for_fallback(self):
         provider = LongbridgeSearchProvider(_lb_config())
 
@@ -237,6 +237,33 @@ class MarketDataServiceQuoteFallbackTest(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(provider.batch_calls, 1)
             self.assertEqual(provider.single_calls, [("TSLA", "US")])
 
+    async def test_batch_quote_filters_and_normalizes_items_in_one_pass(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "data").mkdir(parents=True, exist_ok=True)
+            db_url = f"sqlite:///{root / 'data' / 'market_reporter.db'}"
+            config = AppConfig(
+                output_root=root / "output",
+                config_file=root / "config" / "settings.yaml",
+                database=DatabaseConfig(url=db_url),
+            )
+            config.modules.market_data.default_provider = "composite"
+            provider = _BatchPartialProvider()
+            service = MarketDataService(
+                config=config,
+                registry=_FixedCompositeRegistry(provider),
+            )
+
+            rows = await service.get_quotes(
+                items=[(" aapl ", " us "), ("", "US"), ("7203", "JP"), ("700", "hk")]
+            )
+
+            self.assertEqual(
+                [(row.symbol, row.market) for row in rows],
+                [("AAPL", "US"), ("0700.HK", "HK")],
+            )
+            self.assertEqual(provider.single_calls, [("0700.HK", "HK")])
+
     async def test_quote_fallback_to_composite_when_default_provider_fails(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -3,6 +3,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -25,6 +26,7 @@ from market_reporter.schemas import (
 )
 from market_reporter.services.config_store import ConfigStore
 from market_reporter.modules.reports.service import ReportService
+from market_reporter.modules.reports.skills import extract_agent_run_stats
 from market_reporter.settings import AppSettings
 
 
@@ -703,5 +705,23 @@ class ReportServiceTest(unittest.TestCase):
             self.assertIn("runtime config unavailable", error_text)
 
 
+class ExtractAgentRunStatsTest(unittest.TestCase):
+    def test_tool_warnings_are_deduplicated_in_order(self):
+        run = SimpleNamespace(
+            analysis_input={
+                "tool_results": {
+                    "search_news": {"items": [{}, {}], "warnings": ["rss_timeout", " "]},
+                    "get_metrics": {"warnings": ["fallback_yfinance", "rss_timeout"]},
+                }
+            },
+            guardrail_issues=[],
+        )
+
+        news_total, warnings = extract_agent_run_stats(run)
+
+        self.assertEqual(news_total, 2)
+        self.assertEqual(warnings, ["rss_timeout", "fallback_yfinance"])
+
+
 if __name__ == "__main__":
     unittest.main()
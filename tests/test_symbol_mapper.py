@@ -1,6 +1,7 @@
 import unittest
 
 from market_reporter.modules.market_data.symbol_mapper import (
+    infer_market_from_symbol,
     looks_like_index_symbol,
     normalize_symbol,
     strip_market_suffix,
@@ -65,6 +66,23 @@ class SymbolMapperTest(unittest.TestCase):
         # CN index tickers are normalized to SH suffix
         self.assertEqual(to_longbridge_symbol("^000001", "CN"), "000001.SH")
 
+    def test_infer_market_from_symbol(self):
+        self.assertEqual(infer_market_from_symbol("0700.hk"), "HK")
+        self.assertEqual(infer_market_from_symbol(" 600519.SH ", "US"), "CN")
+        self.assertEqual(infer_market_from_symbol("430047.BJ"), "CN")
+        self.assertEqual(infer_market_from_symbol("AAPL", "hk"), "HK")
+        # A bare ticker that spells a suffix is not a suffix.
+        self.assertEqual(infer_market_from_symbol("HK", "US"), "US")
+        self.assertEqual(infer_market_from_symbol("BRK.B", ""), "US")
+
+    def test_symbol_conversions_are_memoised(self):
+        first = to_longbridge_symbol("700", "HK")
+        hits = to_longbridge_symbol.cache_info().hits
+
+        self.assertIs(to_longbridge_symbol("700", "HK"), first)
+        self.assertEqual(to_longbridge_symbol.cache_info().hits, hits + 1)
+        self.assertGreater(normalize_symbol.cache_info().currsize, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 import pandas as pd
 
+from market_reporter.core.types import KLineBar
 from market_reporter.modules.market_data.providers.yfinance_provider import (
     YahooFinanceMarketDataProvider,
 )
@@ -56,6 +57,109 @@ class YahooFinanceProviderTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(quote.volume, 1200.0)
         self.assertEqual(quote.currency, "USD")
 
+    async def test_get_quote_reads_each_fast_info_key_once(self):
+        lookups = []
+
+        class _CountingFastInfo(dict):
+            def get(self, key, default=None):
+                lookups.append(key)
+                return super().get(key, default)
+
+        class _FastPriceTicker:
+            def __init__(self, symbol: str) -> None:
+                del symbol
+                self.fast_info = _CountingFastInfo(
+                    last_price=105.0,
+                    previous_close=100.0,
+                    last_volume=5000,
+                    currency="USD",
+                )
+
+        fake_module = SimpleNamespace(Ticker=_FastPriceTicker)
+        with patch.dict("sys.modules", {"yfinance": fake_module}):
+            quote = await YahooFinanceMarketDataProvider().get_quote("AAPL", "US")
+
+        self.assertAlmostEqual(quote.change or 0.0, 5.0)
+        self.assertEqual(quote.currency, "USD")
+        self.assertEqual(len(lookups), len(set(lookups)))
+
+    async def test_get_kline_reads_bars_column_wise(self):
+        fake_module = SimpleNamespace(Ticker=_FakeTickerNoFastPrice)
+        with patch.dict("sys.modules", {"yfinance": fake_module}):
+            provider = YahooFinanceMarketDataProvider()
+            bars = await provider.get_kline("AAPL", "us", interval="1d", limit=1)
+
+        self.assertEqual(len(bars), 1)
+        bar = bars[0]
+        self.assertEqual(bar.market, "US")
+        self.assertEqual(bar.ts, "2026-02-21T00:00:00+00:00")
+        self.assertEqual(
+            (bar.open, bar.high, bar.low, bar.close, bar.volume),
+            (101.0, 104.0, 100.0, 103.0, 1200.0),
+        )
+        self.assertEqual(KLineBar.model_validate(bar.model_dump()), bar)
+        self.assertIsInstance(bar.volume, float)
+
+    async def test_get_kline_skips_bars_with_missing_prices(self):
+        class _GappyTicker(_FakeTickerNoFastPrice):
+            def history(self, period: str, interval: str):
+                frame = super().history(period=period, interval=interval)
+                frame.loc[frame.index[0], "Open"] = float("nan")
+                frame.loc[frame.index[1], "Volume"] = float("nan")
+                return frame
+
+        fake_module = SimpleNamespace(Ticker=_GappyTicker)
+        with patch.dict("sys.modules", {"yfinance": fake_module}):
+            provider = YahooFinanceMarketDataProvider()
+            bars = await provider.get_kline("AAPL", "US", interval="1d", limit=5)
+
+        self.assertEqual([bar.ts for bar in bars], ["2026-02-21T00:00:00+00:00"])
+        self.assertIsNone(bars[0].volume)
+        self.assertIsInstance(bars[0].close, float)
+
+    async def test_get_kline_tolerates_missing_volume_column(self):
+        class _NoVolumeTicker(_FakeTickerNoFastPrice):
+            def history(self, period: str, interval: str):
+                frame = super().history(period=period, interval=interval)
+                return frame.drop(columns=["Volume"])
+
+        fake_module = SimpleNamespace(Ticker=_NoVolumeTicker)
+        with patch.dict("sys.modules", {"yfinance": fake_module}):
+            provider = YahooFinanceMarketDataProvider()
+            bars = await provider.get_kline("AAPL", "US", interval="1d", limit=5)
+
+        self.assertEqual([bar.close for bar in bars], [101.5, 103.0])
+        self.assertEqual([bar.volume for bar in bars], [None, None])
+
+    async def test_get_quotes_skips_tickers_missing_from_download(self):
+        index = pd.to_datetime(
+            [
+                datetime(2026, 2, 20, 0, 0, tzinfo=timezone.utc),
+                datetime(2026, 2, 21, 0, 0, tzinfo=timezone.utc),
+            ]
+        )
+        columns = pd.MultiIndex.from_product([["AAPL", "MSFT"], ["Close", "Volume"]])
+        frame = pd.DataFrame(
+            [[100.0, 10.0, 200.0, 20.0], [110.0, 11.0, 190.0, 21.0]],
+            index=index,
+            columns=columns,
+        )
+
+        def fake_download(symbols, **kwargs):
+            del symbols, kwargs
+            return frame
+
+        fake_module = SimpleNamespace(download=fake_download)
+        with patch.dict("sys.modules", {"yfinance": fake_module}):
+            provider = YahooFinanceMarketDataProvider()
+            quotes = await provider.get_quotes(
+                [("AAPL", "US"), ("NVDA", "US"), ("MSFT", "US")]
+            )
+
+        self.assertEqual([quote.symbol for quote in quotes], ["AAPL", "MSFT"])
+        self.assertAlmostEqual(quotes[0].change_percent or 0.0, 10.0)
+        self.assertEqual(quotes[1].volume, 21.0)
+
 
 if __name__ == "__main__":
     unittest.main()
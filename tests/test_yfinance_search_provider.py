@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import unittest
+
+from market_reporter.modules.symbol_search.providers.yfinance_search_provider import (
+    YahooFinanceSearchProvider,
+)
+
+
+class YahooFinanceSearchProviderTest(unittest.TestCase):
+    def test_build_results_falls_back_across_field_aliases(self):
+        rows = [
+            {"symbol": "0700.HK", "exchDisp": "HKEX", "longname": "Tencent Holdings"},
+            {
+                "symbol": "aapl",
+                "exchange": "NMS",
+                "shortname": "",
+                "longname": "Apple Inc.",
+                "fullExchangeName": "NasdaqGS",
+            },
+            {"symbol": "MSFT", "shortname": None},
+            "not-a-row",
+        ]
+
+        results = YahooFinanceSearchProvider()._build_results(
+            rows=rows, query="a", target_market="ALL", limit=10
+        )
+
+        self.assertEqual(
+            [(r.symbol, r.market, r.name, r.exchange) for r in results],
+            [
+                ("0700.HK", "HK", "Tencent Holdings", ""),
+                ("AAPL", "US", "Apple Inc.", "NMS"),
+                ("MSFT", "US", "MSFT", ""),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()